@@ -25,7 +25,7 @@ CORE_DEPS = [
     "python-dotenv>=1.0.0,<2.0.0",
     "httpx>=0.27.0,<0.28.0",
     "aiohttp>=3.9.0,<4.0.0",
-    "python-multipart>=0.0.6,<1.0.0",
+    "python-multipart>=0.0.9,<1.0.0",
     "Pillow>=10.1.0,<11.0.0",
     "structlog>=23.2.0,<24.0.0",
     "asyncio-throttle>=1.0.0,<2.0.0",
@@ -4,8 +4,8 @@ Replaces in-memory session storage with database persistence while maintaining
 API compatibility with existing clients.
 """
 
-import json
 import os
+import secrets
 from datetime import datetime
 from typing import Any, Optional
 
@@ -19,7 +19,7 @@ from fastapi import (
     UploadFile,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
 from pydantic import BaseModel, Field
 
 from ..behavioral.crews import (
@@ -392,7 +392,7 @@ def create_database_app() -> FastAPI:
             )
 
             # Generate request ID for behavioral validation
-            request_id = f"behavioral_{datetime.now().isoformat()}"
+            request_id = f"behavioral_{datetime.now().isoformat()}_{secrets.token_hex(4)}"
 
             # Start validation in background
             async def run_behavioral_validation():
@@ -602,7 +602,8 @@ def create_database_app() -> FastAPI:
             report_content = await reporter.generate_report(session, format)
 
             if format == "json":
-                return JSONResponse(content=json.loads(report_content))
+                # Already JSON-encoded; send it without a decode/encode round trip
+                return Response(content=report_content, media_type="application/json")
             if format == "html":
                 return PlainTextResponse(content=report_content, media_type="text/html")
             if format == "pdf":
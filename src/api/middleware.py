@@ -4,9 +4,14 @@ Integrates all security components including input validation, API key authentic
 rate limiting, and comprehensive audit logging.
 """
 
+import asyncio
 import json
+import os
+import re
 import uuid
+from collections.abc import Iterable
 from datetime import datetime
+from typing import Optional
 
 from fastapi import HTTPException, Request, Response, status
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -17,6 +22,16 @@ from ..core.logging import logger
 from ..security.audit import AuditEventType, AuditSeverity, security_audit
 from ..security.validation import SecurityValidationError, SecurityValidator
 
+# Headers excluded from attack pattern analysis (raw ASGI names are lowercase)
+_SENSITIVE_HEADER_BYTES = frozenset({b"authorization", b"x-api-key", b"cookie"})
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 
 def validate_request(request_data: dict) -> dict:
     """Simple request validation function for backward compatibility."""
@@ -31,29 +46,50 @@ def validate_request(request_data: dict) -> dict:
 class SecurityMiddleware(BaseHTTPMiddleware):
     """Comprehensive security middleware with integrated validation and audit logging."""
 
+    # Liveness, metrics and docs routes polled at high frequency by load
+    # balancers and scrapers; these skip validation and audit logging.
+    _BYPASS_PATHS = frozenset(
+        {
+            "/health",
+            "/healthz",
+            "/ready",
+            "/metrics",
+            "/openapi.json",
+            "/docs",
+            "/redoc",
+        }
+    )
+
     def __init__(
         self,
         app: ASGIApp,
         enable_input_validation: bool = True,
         enable_audit_logging: bool = True,
         enable_attack_detection: bool = True,
+        bypass_paths: Optional[Iterable[str]] = None,
     ):
         super().__init__(app)
         self.settings = get_settings()
+        self.bypass_paths = (
+            frozenset(bypass_paths)
+            if bypass_paths is not None
+            else self._BYPASS_PATHS
+        )
         self.security_validator = SecurityValidator()
         self.enable_input_validation = enable_input_validation
         self.enable_audit_logging = enable_audit_logging
         self.enable_attack_detection = enable_attack_detection
         self.logger = logger.bind(middleware="SecurityMiddleware")
 
-        # Attack detection patterns
+        # Attack detection patterns. Request fields are scanned as one
+        # NUL-delimited buffer, so no pattern may match across \x00
         self.attack_patterns = {
             "sql_injection": [
                 r"('|(\\'))|(;|--|\s+or\s+|\s+and\s+)",
                 r"(union\s+select|insert\s+into|delete\s+from|drop\s+table)",
             ],
             "xss": [
-                r"<script[^>]*>.*?</script>",
+                r"<script[^>\x00]*>[^\x00\n]*?</script>",
                 r"javascript:",
                 r"on\w+\s*=",
             ],
@@ -66,12 +102,79 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                 r"(rm\s|del\s|format\s|mkfs\s)",
             ],
         }
+        self._compiled_attack_patterns = [
+            (attack_type, pattern, re.compile(pattern.encode("utf-8"), re.IGNORECASE))
+            for attack_type, patterns in self.attack_patterns.items()
+            for pattern in patterns
+        ]
+
+        # Optional Hyperscan database scanning all patterns in one pass, with a
+        # pool of scratch spaces so concurrent scans never share one
+        self._hs_db = None
+        self._scratch_pool: Optional[asyncio.Queue] = None
+        if HYPERSCAN_AVAILABLE:
+            self._init_hyperscan()
+
+    def _init_hyperscan(self):
+        """Compile attack patterns into a Hyperscan database and scratch pool."""
+        expressions = [
+            pattern.encode("utf-8") for _, pattern, _ in self._compiled_attack_patterns
+        ]
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[flags] * len(expressions),
+            )
+        except hyperscan.error as e:
+            self.logger.warning(
+                "Hyperscan compilation failed, using re patterns", error=str(e)
+            )
+            return
+
+        pool_size = max(
+            1,
+            min((os.cpu_count() or 1) * 2, self.settings.async_concurrency_limit),
+        )
+        scratch = hyperscan.Scratch(db)
+        self._scratch_pool = asyncio.Queue()
+        self._scratch_pool.put_nowait(scratch)
+        for _ in range(pool_size - 1):
+            self._scratch_pool.put_nowait(scratch.clone())
+        self._hs_db = db
+
+    async def _hyperscan_match(self, data: bytes) -> Optional[tuple[int, int]]:
+        """Scan data off the event loop, returning (pattern index, match end)."""
+        matches = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            matches.append((pattern_id, end))
+
+        scratch = await self._scratch_pool.get()
+        try:
+            await asyncio.to_thread(
+                self._hs_db.scan,
+                data,
+                match_event_handler=on_match,
+                scratch=scratch,
+            )
+        finally:
+            self._scratch_pool.put_nowait(scratch)
+
+        return min(matches) if matches else None
 
     async def dispatch(self, request: Request, call_next):
         # Generate request ID for tracking
         request_id = str(uuid.uuid4())
         request.state.request_id = request_id
 
+        # Fast path for health/metrics/docs traffic
+        if request.url.path in self.bypass_paths:
+            return await call_next(request)
+
         # Extract client information
         client_ip = self._get_client_ip(request)
         user_agent = request.headers.get("user-agent", "")
@@ -314,47 +417,60 @@ class SecurityMiddleware(BaseHTTPMiddleware):
 
     async def _detect_attacks(self, request: Request):
         """Detect potential attack patterns."""
-        # Combine all request data for analysis
-        analysis_data = []
-
-        # URL and query parameters
-        analysis_data.append(str(request.url))
+        # Combine all request data into one NUL-delimited buffer so each
+        # pattern is searched once per request rather than once per item
+        buf_parts = [str(request.url).encode("utf-8")]
 
         # Headers (excluding sensitive ones)
-        for header_name, header_value in request.headers.items():
-            if header_name.lower() not in ["authorization", "x-api-key", "cookie"]:
-                analysis_data.append(header_value)
+        for header_name, header_value in request.headers.raw:
+            if header_name.lower() not in _SENSITIVE_HEADER_BYTES:
+                buf_parts.append(header_value)
 
         # Request body (if JSON)
         try:
             if "application/json" in request.headers.get("content-type", ""):
                 body = await request.body()
                 if body:
-                    analysis_data.append(body.decode("utf-8", errors="ignore"))
+                    buf_parts.append(body)
         except BaseException:
             pass  # Skip body analysis if it fails
 
+        buf = b"\x00".join(buf_parts)
+
         # Analyze for attack patterns
-        for data_item in analysis_data:
-            for attack_type, patterns in self.attack_patterns.items():
-                for pattern in patterns:
-                    import re
-
-                    if re.search(pattern, data_item, re.IGNORECASE):
-                        await security_audit.log_attack_attempt(
-                            attack_type=attack_type,
-                            source_ip=request.state.client_ip,
-                            user_agent=request.state.user_agent,
-                            details={
-                                "pattern_matched": pattern,
-                                "data_sample": data_item[:100],
-                            },
-                            request_id=request.state.request_id,
-                        )
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"Potential {attack_type} detected",
-                        )
+        if self._hs_db is not None:
+            match = await self._hyperscan_match(buf)
+        else:
+            match = next(
+                (
+                    (index, found.end())
+                    for index, (_, _, compiled) in enumerate(
+                        self._compiled_attack_patterns
+                    )
+                    if (found := compiled.search(buf))
+                ),
+                None,
+            )
+
+        if match is not None:
+            match_index, match_end = match
+            attack_type, pattern, _ = self._compiled_attack_patterns[match_index]
+            await security_audit.log_attack_attempt(
+                attack_type=attack_type,
+                source_ip=request.state.client_ip,
+                user_agent=request.state.user_agent,
+                details={
+                    "pattern_matched": pattern,
+                    "data_sample": buf[max(0, match_end - 100) : match_end]
+                    .replace(b"\x00", b" ")
+                    .decode("utf-8", errors="ignore"),
+                },
+                request_id=request.state.request_id,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Potential {attack_type} detected",
+            )
 
     async def _log_successful_request(
         self,
@@ -456,17 +572,17 @@ class SecurityMiddleware(BaseHTTPMiddleware):
 
 
 # Legacy middleware for backward compatibility
-class InputValidationMiddleware(BaseHTTPMiddleware):
-    """Legacy input validation middleware - use SecurityMiddleware instead."""
+class InputValidationMiddleware(SecurityMiddleware):
+    """Legacy input validation middleware - use SecurityMiddleware instead.
+
+    Runs the SecurityMiddleware pipeline directly instead of delegating to a
+    second wrapped middleware instance, so each request is validated once.
+    """
 
     def __init__(self, app: ASGIApp, enable_path_traversal_prevention: bool = True):
-        super().__init__(app)
-        self.security_middleware = SecurityMiddleware(
+        super().__init__(
             app,
             enable_input_validation=True,
             enable_audit_logging=False,
             enable_attack_detection=enable_path_traversal_prevention,
         )
-
-    async def dispatch(self, request: Request, call_next):
-        return await self.security_middleware.dispatch(request, call_next)
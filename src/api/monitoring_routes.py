@@ -2,20 +2,256 @@
 Prometheus metrics, health checks, and observability endpoints.
 """
 
-from typing import Any, Optional
-
-from fastapi import APIRouter, HTTPException, Query, Response
-from fastapi.responses import PlainTextResponse
-from src.monitoring.health import HealthStatus, health_monitor
+import asyncio
+import functools
+import gzip
+import time
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any, Callable, Literal, Optional
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
+from src.monitoring.health import HealthCheck, HealthStatus, health_monitor
 from src.monitoring.logging import structured_logger
 from src.monitoring.metrics import metrics_collector
 from src.services.task_queue import async_validation_service
 
+# Accepted query parameter values, validated by FastAPI before the handler runs
+AlertSeverity = Literal["warning", "critical", "info"]
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+# Response models
+class HealthSummary(BaseModel):
+    """Aggregate counts for a health check run."""
+
+    total_checks: int
+    healthy_checks: int
+    failed_checks: int
+    critical_failures: int
+
+
+class HealthResponse(BaseModel):
+    """Response for the system health endpoint."""
+
+    status: HealthStatus
+    timestamp: str
+    duration_ms: float
+    summary: HealthSummary
+    checks: Optional[dict[str, dict[str, Any]]] = None
+
+
+class SystemInfo(BaseModel):
+    """Top-level system information."""
+
+    status: HealthStatus
+    uptime: str
+    version: str
+    environment: str
+
+
+class HealthOverview(BaseModel):
+    """Health section of the system status."""
+
+    overall_status: HealthStatus
+    healthy_checks: int
+    total_checks: int
+    critical_failures: int
+
+
+class PerformanceInfo(BaseModel):
+    """Performance section of the system status."""
+
+    active_requests: str
+    avg_response_time: str
+    error_rate: str
+
+
+class QueueInfo(BaseModel):
+    """Task queue section of the system status."""
+
+    active_tasks: int
+    scheduled_tasks: int
+    worker_count: int
+    queue_health: str
+
+
+class ResourceInfo(BaseModel):
+    """Resource usage section of the system status."""
+
+    memory_usage: str
+    cpu_usage: str
+    disk_usage: str
+
+
+class SystemStatusResponse(BaseModel):
+    """Response for the comprehensive system status endpoint."""
+
+    system: SystemInfo
+    health: HealthOverview
+    performance: PerformanceInfo
+    queue: QueueInfo
+    resources: ResourceInfo
+
+
+# Background task refreshing psutil-backed gauges off the request path
+_system_metrics_task: Optional[asyncio.Task] = None
+
+
+async def _system_metrics_loop():
+    """Refresh system resource gauges at a fixed cadence in a worker thread."""
+    interval = health_monitor.config.settings.system_metrics_interval
+    while True:
+        try:
+            await asyncio.to_thread(metrics_collector.update_system_metrics)
+        except Exception as e:
+            structured_logger.log_error(
+                error=e,
+                component="metrics_endpoint",
+                operation="update_system_metrics",
+            )
+        await asyncio.sleep(interval)
+
+
+async def start_system_metrics():
+    """Start the system metrics loop if it is not already running."""
+    global _system_metrics_task
+    if _system_metrics_task is None or _system_metrics_task.done():
+        _system_metrics_task = asyncio.create_task(_system_metrics_loop())
+
+
+async def stop_system_metrics():
+    """Cancel the system metrics loop."""
+    global _system_metrics_task
+    if _system_metrics_task is not None:
+        _system_metrics_task.cancel()
+        _system_metrics_task = None
+
+
 # Create router
-router = APIRouter(prefix="/monitoring", tags=["monitoring"])
+router = APIRouter(
+    prefix="/monitoring",
+    tags=["monitoring"],
+    on_startup=[start_system_metrics],
+    on_shutdown=[stop_system_metrics],
+)
+
+# Prometheus exposition content type and static response headers, built once
+_METRICS_MEDIA = "text/plain; version=0.0.4; charset=utf-8"
+_METRICS_HEADERS = {"Content-Type": _METRICS_MEDIA, "Vary": "Accept-Encoding"}
+_METRICS_GZIP_HEADERS = {**_METRICS_HEADERS, "Content-Encoding": "gzip"}
+
+# Non-standard status (nginx convention) for requests the client abandoned
+_CLIENT_CLOSED_REQUEST = 499
+
+# Generated Prometheus output shared by all scrapes within the TTL window
+_metrics_cache: dict[str, Any] = {
+    "body": None,
+    "gzip": None,
+    "expires": 0.0,
+}
+
+# In-flight regenerations keyed by cache name; concurrent scrapes await the same task
+_inflight: dict[str, asyncio.Task] = {}
+
+# Last formatted timestamp, reused for requests within the same 100ms window
+_timestamp_cache: dict[str, Any] = {"at": float("-inf"), "iso": ""}
+
+# Checks gating readiness, bound once after the default checks are registered
+_CRITICAL_CHECKS: tuple[tuple[str, HealthCheck], ...] = tuple(
+    (name, health_monitor.health_checks[name])
+    for name in ("redis_connectivity", "configuration")
+    if name in health_monitor.health_checks
+)
+
+# Static JSON payloads serialised once; only the timestamp is spliced in per request
+_CUSTOM_METRICS_BODY = orjson.dumps(
+    {
+        "metrics": {
+            "validation_stats": {
+                "total_validations": "Counter data would go here",
+                "avg_fidelity_score": "Average calculation",
+                "popular_tech_pairs": "Top technology pairs",
+            },
+            "performance_stats": {
+                "avg_response_time": "Response time metrics",
+                "error_rate": "Error rate calculation",
+                "throughput": "Requests per second",
+            },
+            "resource_usage": {
+                "cpu_percent": "CPU usage percentage",
+                "memory_usage": "Memory usage metrics",
+                "disk_usage": "Disk usage metrics",
+            },
+        },
+    }
+)
+_EMPTY_ALERTS_BODY = orjson.dumps(
+    {
+        "active_alerts": [],
+        "total_count": 0,
+        "by_severity": {
+            "critical": 0,
+            "warning": 0,
+            "info": 0,
+        },
+    }
+)
+
+# Resolved once: the result cache may not expose cache statistics at all
+_cache_stats_fn: Optional[Callable[[], dict[str, Any]]] = getattr(
+    async_validation_service.result_cache, "_get_cache_stats", None
+)
+
+
+def _now_iso() -> str:
+    """Return the current UTC time in ISO 8601, formatted at most every 100ms."""
+    now = time.monotonic()
+    if now - _timestamp_cache["at"] >= 0.1:
+        _timestamp_cache["iso"] = datetime.now(timezone.utc).isoformat()
+        _timestamp_cache["at"] = now
+    return _timestamp_cache["iso"]
+
+
+def monitored(component: str, operation: str, detail: str, *context: str):
+    """Log unexpected endpoint errors and convert them to HTTP 500.
+
+    ``operation`` and ``detail`` are formatted with the endpoint's keyword
+    arguments, and the arguments named in ``context`` are added to the error
+    log entry. HTTPExceptions raised by the endpoint pass through unchanged.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                structured_logger.log_error(
+                    error=e,
+                    component=component,
+                    operation=operation.format(**kwargs),
+                    **{name: kwargs[name] for name in context},
+                )
+                raise HTTPException(status_code=500, detail=detail.format(**kwargs))
 
+        return wrapper
 
-@router.get("/health", response_model=dict[str, Any])
+    return decorator
+
+
+def _with_timestamp(body: bytes) -> bytes:
+    """Prepend a "timestamp" field to a pre-serialised JSON object."""
+    return b'{"timestamp":"' + _now_iso().encode() + b'",' + body[1:]
+
+
+@router.get("/health", response_model=HealthResponse)
+@monitored("health_endpoint", "health_check", "Health check failed")
 async def health_check(
     include_details: bool = Query(
         True, description="Include detailed health check results"
@@ -24,32 +260,24 @@ async def health_check(
     """System health check endpoint.
     Returns overall system health status and individual component checks.
     """
-    try:
-        health_result = await health_monitor.check_health(
-            include_details=include_details
-        )
-
-        # Determine HTTP status code based on health
-        if health_result["status"] == HealthStatus.UNHEALTHY:
-            status_code = 503  # Service Unavailable
-        elif health_result["status"] == HealthStatus.DEGRADED:
-            status_code = 200  # OK but with warnings
-        else:
-            status_code = 200  # OK
-
-        return Response(
-            content=health_result,
-            status_code=status_code,
-            media_type="application/json",
-        )
-
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="health_endpoint",
-            operation="health_check",
-        )
-        raise HTTPException(status_code=500, detail="Health check failed")
+    if include_details:
+        health_result = await health_monitor.check_health(include_details=True)
+    else:
+        health_result = await health_monitor.cached_check_health()
+
+    # Determine HTTP status code based on health
+    if health_result["status"] == HealthStatus.UNHEALTHY:
+        status_code = 503  # Service Unavailable
+    elif health_result["status"] == HealthStatus.DEGRADED:
+        status_code = 200  # OK but with warnings
+    else:
+        status_code = 200  # OK
+
+    return Response(
+        content=HealthResponse(**health_result).model_dump_json(exclude_none=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
 @router.get("/health/live")
@@ -57,7 +285,7 @@ async def liveness_probe():
     """Kubernetes liveness probe endpoint.
     Simple check that the application is running.
     """
-    return {"status": "alive", "timestamp": "now"}
+    return {"status": "alive", "timestamp": _now_iso()}
 
 
 @router.get("/health/ready")
@@ -66,71 +294,117 @@ async def readiness_probe():
     Checks if the application is ready to serve traffic.
     """
     try:
-        # Quick health check for critical components only
-        critical_checks = ["redis_connectivity", "configuration"]
+        # Quick health check for critical components only, run concurrently
+        results = await asyncio.gather(
+            *(check.execute() for _, check in _CRITICAL_CHECKS),
+            return_exceptions=True,
+        )
 
-        for check_name in critical_checks:
-            if check_name in health_monitor.health_checks:
-                check = health_monitor.health_checks[check_name]
-                result = await check.execute()
+        for (check_name, _), result in zip(_CRITICAL_CHECKS, results):
+            if isinstance(result, BaseException):
+                raise result
 
-                if result["status"] != HealthStatus.HEALTHY:
-                    return Response(
-                        content={
-                            "status": "not_ready",
-                            "reason": f"{check_name} unhealthy",
-                        },
-                        status_code=503,
-                    )
+            if result["status"] != HealthStatus.HEALTHY:
+                return ORJSONResponse(
+                    content={
+                        "status": "not_ready",
+                        "reason": f"{check_name} unhealthy",
+                    },
+                    status_code=503,
+                )
 
-        return {"status": "ready", "timestamp": "now"}
+        return {"status": "ready", "timestamp": _now_iso()}
 
     except Exception as e:
-        return Response(
+        return ORJSONResponse(
             content={"status": "not_ready", "reason": str(e)},
             status_code=503,
         )
 
 
 @router.get("/metrics", response_class=PlainTextResponse)
-async def prometheus_metrics():
+@monitored("metrics_endpoint", "generate_metrics", "Metrics generation failed")
+async def prometheus_metrics(request: Request):
     """Prometheus metrics endpoint.
-    Returns metrics in Prometheus format.
+    Returns metrics in Prometheus format, gzip-compressed when accepted.
     """
-    try:
-        # Update dynamic metrics before returning
-        metrics_collector.update_system_metrics()
-
-        # Get queue stats and update metrics
-        queue_stats = async_validation_service.get_queue_stats()
-        metrics_collector.update_queue_metrics(queue_stats)
-
-        # Get cache stats and update metrics
-        cache_stats = (
-            async_validation_service.result_cache._get_cache_stats()
-            if hasattr(async_validation_service.result_cache, "_get_cache_stats")
-            else {}
+    started = time.perf_counter()
+
+    # Covers apps using a lifespan handler, where router startup hooks do not run
+    await start_system_metrics()
+
+    if time.monotonic() >= _metrics_cache["expires"]:
+        task = _inflight.get("metrics")
+        if task is None:
+            # Don't regenerate for a scraper that has already given up
+            if await request.is_disconnected():
+                return Response(status_code=_CLIENT_CLOSED_REQUEST)
+            task = asyncio.create_task(_refresh_metrics_cache())
+            _inflight["metrics"] = task
+            task.add_done_callback(lambda _: _inflight.pop("metrics", None))
+        # Shielded so a disconnecting scraper does not cancel the shared refresh
+        await asyncio.shield(task)
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        # Compress once per cache window and reuse for every gzip scrape
+        if _metrics_cache["gzip"] is None:
+            if await request.is_disconnected():
+                return Response(status_code=_CLIENT_CLOSED_REQUEST)
+            _metrics_cache["gzip"] = gzip.compress(
+                _metrics_cache["body"], compresslevel=1
+            )
+        response = Response(
+            content=_metrics_cache["gzip"], headers=_METRICS_GZIP_HEADERS
         )
-        metrics_collector.update_cache_metrics(cache_stats)
-
-        # Generate Prometheus metrics
-        metrics_output = metrics_collector.generate_metrics()
-
-        return Response(
-            content=metrics_output,
-            media_type="text/plain; version=0.0.4; charset=utf-8",
+    else:
+        response = StreamingResponse(
+            _iter_chunks(_metrics_cache["body"]), headers=_METRICS_HEADERS
         )
 
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="metrics_endpoint",
-            operation="generate_metrics",
-        )
-        raise HTTPException(status_code=500, detail="Metrics generation failed")
+    response.headers["Server-Timing"] = (
+        f"metrics;dur={(time.perf_counter() - started) * 1000:.2f}"
+    )
+    return response
+
+
+def _iter_chunks(body: bytes, chunk_size: int = 16 * 1024) -> Iterator[memoryview]:
+    """Yield zero-copy slices of a cached response body."""
+    view = memoryview(body)
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
+
+
+async def _refresh_metrics_cache() -> None:
+    """Regenerate the cached Prometheus output and restart its TTL window."""
+    _metrics_cache["body"] = await _generate_metrics_body()
+    _metrics_cache["gzip"] = None
+    _metrics_cache["expires"] = (
+        time.monotonic() + health_monitor.config.settings.metrics_cache_ttl
+    )
+
+
+async def _generate_metrics_body() -> bytes:
+    """Refresh dynamic metrics and render the Prometheus exposition output."""
+    # Get queue and cache stats and update their gauges in one batch
+    queue_stats = await async_validation_service.get_queue_stats_cached()
+    cache_stats = _cache_stats_fn() if _cache_stats_fn is not None else {}
+    metrics_collector.update_from_mapping(
+        {
+            **metrics_collector.queue_metrics_mapping(queue_stats),
+            **metrics_collector.cache_metrics_mapping(cache_stats),
+        }
+    )
+
+    # Generate Prometheus metrics
+    return metrics_collector.generate_metrics()
 
 
 @router.get("/metrics/custom")
+@monitored(
+    "custom_metrics_endpoint",
+    "generate_custom_metrics",
+    "Custom metrics generation failed",
+)
 async def custom_metrics(
     metric_names: Optional[list[str]] = Query(
         None, description="Specific metrics to return"
@@ -139,232 +413,163 @@ async def custom_metrics(
     """Custom metrics endpoint for specific metric queries.
     Returns structured JSON metrics data.
     """
-    try:
-        # This would be implemented to return specific metrics in JSON format
-        # for custom dashboards or integrations
-
-        custom_data = {
-            "timestamp": "now",
-            "metrics": {
-                "validation_stats": {
-                    "total_validations": "Counter data would go here",
-                    "avg_fidelity_score": "Average calculation",
-                    "popular_tech_pairs": "Top technology pairs",
-                },
-                "performance_stats": {
-                    "avg_response_time": "Response time metrics",
-                    "error_rate": "Error rate calculation",
-                    "throughput": "Requests per second",
-                },
-                "resource_usage": {
-                    "cpu_percent": "CPU usage percentage",
-                    "memory_usage": "Memory usage metrics",
-                    "disk_usage": "Disk usage metrics",
-                },
-            },
-        }
+    # This would be implemented to return specific metrics in JSON format
+    # for custom dashboards or integrations
 
-        return custom_data
-
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="custom_metrics_endpoint",
-            operation="generate_custom_metrics",
-        )
-        raise HTTPException(status_code=500, detail="Custom metrics generation failed")
+    return Response(
+        content=_with_timestamp(_CUSTOM_METRICS_BODY),
+        media_type="application/json",
+    )
 
 
-@router.get("/status")
+@router.get("/status", response_model=SystemStatusResponse)
+@monitored("status_endpoint", "get_system_status", "Status retrieval failed")
 async def system_status():
     """Comprehensive system status endpoint.
     Returns detailed system information for dashboards.
     """
-    try:
-        # Get health status
-        health_result = await health_monitor.check_health(include_details=False)
-
-        # Get queue statistics
-        queue_stats = async_validation_service.get_queue_stats()
-
-        # Compile comprehensive status
-        status = {
-            "system": {
-                "status": health_result["status"],
-                "uptime": "Would calculate uptime here",
-                "version": "1.0.0",
-                "environment": health_monitor.config.settings.environment,
-            },
-            "health": {
-                "overall_status": health_result["status"],
-                "healthy_checks": health_result["summary"]["healthy_checks"],
-                "total_checks": health_result["summary"]["total_checks"],
-                "critical_failures": health_result["summary"]["critical_failures"],
-            },
-            "performance": {
-                "active_requests": "Would get from metrics",
-                "avg_response_time": "Would calculate from metrics",
-                "error_rate": "Would calculate from metrics",
-            },
-            "queue": {
-                "active_tasks": queue_stats["active_tasks"],
-                "scheduled_tasks": queue_stats["scheduled_tasks"],
-                "worker_count": len(queue_stats["workers"]),
-                "queue_health": "healthy"
-                if queue_stats["active_tasks"] < 50
-                else "busy",
-            },
-            "resources": {
-                "memory_usage": "Would get from system metrics",
-                "cpu_usage": "Would get from system metrics",
-                "disk_usage": "Would get from system metrics",
-            },
-        }
-
-        return status
-
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="status_endpoint",
-            operation="get_system_status",
-        )
-        raise HTTPException(status_code=500, detail="Status retrieval failed")
+    # Get health status
+    health_result = await health_monitor.cached_check_health()
+
+    # Get queue statistics
+    queue_stats = await async_validation_service.get_queue_stats_cached()
+
+    # Compile comprehensive status
+    summary = health_result["summary"]
+    status = SystemStatusResponse(
+        system=SystemInfo(
+            status=health_result["status"],
+            uptime="Would calculate uptime here",
+            version="1.0.0",
+            environment=health_monitor.config.settings.environment,
+        ),
+        health=HealthOverview(
+            overall_status=health_result["status"],
+            healthy_checks=summary["healthy_checks"],
+            total_checks=summary["total_checks"],
+            critical_failures=summary["critical_failures"],
+        ),
+        performance=PerformanceInfo(
+            active_requests="Would get from metrics",
+            avg_response_time="Would calculate from metrics",
+            error_rate="Would calculate from metrics",
+        ),
+        queue=QueueInfo(
+            active_tasks=queue_stats["active_tasks"],
+            scheduled_tasks=queue_stats["scheduled_tasks"],
+            worker_count=len(queue_stats["workers"]),
+            queue_health="healthy"
+            if queue_stats["active_tasks"] < 50
+            else "busy",
+        ),
+        resources=ResourceInfo(
+            memory_usage="Would get from system metrics",
+            cpu_usage="Would get from system metrics",
+            disk_usage="Would get from system metrics",
+        ),
+    )
+
+    return Response(content=status.model_dump_json(), media_type="application/json")
 
 
 @router.post("/health/check/{check_name}")
+@monitored(
+    "individual_health_check",
+    "check_{check_name}",
+    "Health check '{check_name}' failed",
+)
 async def run_individual_health_check(check_name: str):
     """Run a specific health check on demand.
     Useful for debugging and manual verification.
     """
-    try:
-        if check_name not in health_monitor.health_checks:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Health check '{check_name}' not found",
-            )
-
-        check = health_monitor.health_checks[check_name]
-        result = await check.execute()
-
-        return {
-            "check_name": check_name,
-            "result": result,
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="individual_health_check",
-            operation=f"check_{check_name}",
-        )
+    check = health_monitor.health_checks.get(check_name)
+    if check is None:
         raise HTTPException(
-            status_code=500, detail=f"Health check '{check_name}' failed"
+            status_code=404,
+            detail=f"Health check '{check_name}' not found",
         )
 
+    result = await check.execute()
+    health_monitor.invalidate_health_cache()
+
+    return Response(
+        content=orjson.dumps({"check_name": check_name, "result": result}),
+        media_type="application/json",
+    )
+
 
 @router.get("/alerts")
+@monitored("alerts_endpoint", "get_active_alerts", "Alert retrieval failed")
 async def get_active_alerts(
-    severity: Optional[str] = Query(
-        None, description="Filter by severity: warning, critical"
+    severity: Optional[AlertSeverity] = Query(
+        None, description="Filter by severity: warning, critical, info"
     ),
 ):
     """Get active system alerts.
     Returns current alerts and warnings from monitoring systems.
     """
-    try:
-        # This would integrate with actual alerting system
-        # For now, return example structure
-
-        alerts = {
-            "active_alerts": [],
-            "total_count": 0,
-            "by_severity": {
-                "critical": 0,
-                "warning": 0,
-                "info": 0,
-            },
-            "timestamp": "now",
-        }
+    # This would integrate with actual alerting system
+    # For now, return example structure
 
-        # Example alerts would be populated here based on metrics thresholds
-        # and health check results
+    # Example alerts would be populated here based on metrics thresholds
+    # and health check results
 
-        return alerts
-
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="alerts_endpoint",
-            operation="get_active_alerts",
-        )
-        raise HTTPException(status_code=500, detail="Alert retrieval failed")
+    return Response(
+        content=_with_timestamp(_EMPTY_ALERTS_BODY), media_type="application/json"
+    )
 
 
 @router.post("/alerts/acknowledge/{alert_id}")
+@monitored(
+    "alerts_endpoint",
+    "acknowledge_alert",
+    "Alert acknowledgment failed",
+    "alert_id",
+)
 async def acknowledge_alert(alert_id: str):
     """Acknowledge an active alert.
     Marks the alert as acknowledged to prevent duplicate notifications.
     """
-    try:
-        # This would integrate with alerting system to acknowledge alerts
+    # This would integrate with alerting system to acknowledge alerts
 
-        structured_logger.log_business_event(
-            event_type="alert_acknowledged",
-            alert_id=alert_id,
-            acknowledged_by="system",  # Would get from auth context
-        )
+    structured_logger.log_business_event(
+        event_type="alert_acknowledged",
+        alert_id=alert_id,
+        acknowledged_by="system",  # Would get from auth context
+    )
 
-        return {
-            "alert_id": alert_id,
-            "status": "acknowledged",
-            "timestamp": "now",
-        }
-
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="alerts_endpoint",
-            operation="acknowledge_alert",
-            alert_id=alert_id,
-        )
-        raise HTTPException(status_code=500, detail="Alert acknowledgment failed")
+    return {
+        "alert_id": alert_id,
+        "status": "acknowledged",
+        "timestamp": _now_iso(),
+    }
 
 
 @router.get("/logs/recent")
+@monitored("logs_endpoint", "get_recent_logs", "Log retrieval failed")
 async def get_recent_logs(
     limit: int = Query(100, description="Number of recent log entries to return"),
-    level: Optional[str] = Query(None, description="Filter by log level"),
+    level: Optional[LogLevel] = Query(None, description="Filter by log level"),
     component: Optional[str] = Query(None, description="Filter by component"),
 ):
     """Get recent log entries.
     Useful for real-time log viewing and debugging.
     """
-    try:
-        # This would integrate with log aggregation system
-        # For now, return example structure
-
-        logs = {
-            "entries": [],
-            "total_count": 0,
-            "filters": {
-                "level": level,
-                "component": component,
-                "limit": limit,
-            },
-            "timestamp": "now",
-        }
-
-        # Recent log entries would be populated here from log storage
+    # Served from the logger's in-memory buffer of recent entries
+    entries = structured_logger.recent_entries(limit, level, component)
+
+    logs = {
+        "entries": entries,
+        "total_count": len(entries),
+        "filters": {
+            "level": level,
+            "component": component,
+            "limit": limit,
+        },
+        "timestamp": _now_iso(),
+    }
+
+    return Response(
+        content=orjson.dumps(logs, default=str), media_type="application/json"
+    )
 
-        return logs
-
-    except Exception as e:
-        structured_logger.log_error(
-            error=e,
-            component="logs_endpoint",
-            operation="get_recent_logs",
-        )
-        raise HTTPException(status_code=500, detail="Log retrieval failed")
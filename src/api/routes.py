@@ -7,12 +7,25 @@ Provides REST API endpoints for migration validation functionality:
 - Report generation and retrieval
 """
 
-import json
+import asyncio
+import functools
 import os
-from datetime import datetime
+import secrets
+import shutil
+import tempfile
+import time
+import zlib
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any
+from itertools import chain, islice, takewhile
+from typing import Any, Literal, Optional
 
+import httpx
+import orjson
+import redis.asyncio as aioredis
+from anyio import to_thread
 from fastapi import (
     BackgroundTasks,
     Depends,
@@ -20,21 +33,38 @@ from fastapi import (
     File,
     Form,
     HTTPException,
+    Query,
+    Request,
     UploadFile,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from src.api.async_routes import router as async_router
 
 from ..behavioral.crews import (
+    BehavioralCrewPool,
     BehavioralValidationRequest,
     create_behavioral_validation_crew,
 )
+from ..behavioral.results import (
+    combine_hybrid_results,
+    record_behavioral_error,
+    serialize_discrepancies,
+)
+from ..core.config import get_settings
 from ..core.input_processor import InputProcessor
 from ..core.migration_validator import MigrationValidator
-from ..core.models import ValidationSession
+from ..core.models import (
+    SeverityLevel,
+    ValidationDiscrepancy,
+    ValidationResult,
+    ValidationSession,
+)
+from ..services.session_store import ValidationSessionStore
+from ..services.task_queue import run_validation_job
 
 
 # Define missing response models for compatibility
@@ -53,7 +83,11 @@ class CompatibilityCheckResponse(BaseModel):
     message: str = ""
 
 
-from ..security.auth import create_access_token, decode_access_token, verify_password
+from ..security.auth import (
+    create_access_token,
+    decode_access_token_cached,
+    verify_password,
+)
 
 
 class UserRole(str, Enum):
@@ -78,10 +112,324 @@ class TechnologyOption(BaseModel):
     label: str
 
 
-# Global storage for validation sessions (in production, use Redis or database)
-validation_sessions: dict[str, ValidationSession] = {}
+# Global storage for behavioral validation sessions (validation sessions live in
+# the Redis-backed ValidationSessionStore)
 behavioral_validation_sessions: dict[str, dict[str, Any]] = {}
 
+# Most recent log entries kept per behavioral session
+BEHAVIORAL_LOG_LIMIT = 1000
+
+# Behavioral sessions kept in memory; the oldest are evicted beyond this
+BEHAVIORAL_SESSION_LIMIT = 10000
+
+
+_session_sweeper_task: Optional[asyncio.Task] = None
+
+
+# Idle behavioral crews reused across validations. The factory is looked up on
+# each call so patching create_behavioral_validation_crew still takes effect.
+behavioral_crews = BehavioralCrewPool(lambda: create_behavioral_validation_crew())
+
+
+def track_behavioral_session(request_id: str, session: dict[str, Any]) -> None:
+    """Add a behavioral session, evicting the oldest beyond BEHAVIORAL_SESSION_LIMIT.
+
+    Sessions are only touched from the event loop, so no locking is needed.
+    """
+    behavioral_validation_sessions[request_id] = session
+    excess = len(behavioral_validation_sessions) - BEHAVIORAL_SESSION_LIMIT
+    if excess > 0:
+        for oldest in list(islice(behavioral_validation_sessions, excess)):
+            del behavioral_validation_sessions[oldest]
+
+
+def behavioral_session_row(request_id: str, session: dict[str, Any]) -> dict[str, Any]:
+    """Summarize a behavioral session for listings.
+
+    The row is built once and kept on the session; background tasks drop it
+    whenever the session's status or result changes.
+    """
+    row = session.get("row")
+    if row is None:
+        row = session["row"] = {
+            "request_id": request_id,
+            "status": session["status"],
+            "created_at": session["created_at"].isoformat(),
+            "source_url": session["request"].source_url,
+            "target_url": session["request"].target_url,
+            "scenarios_count": len(session["request"].validation_scenarios),
+            "fidelity_score": (
+                session["result"].fidelity_score if session["result"] else None
+            ),
+        }
+    return row
+
+
+def evict_expired_behavioral_sessions(ttl: float) -> int:
+    """Drop behavioral sessions created more than ttl seconds ago.
+
+    Returns the number of sessions evicted.
+    """
+    cutoff = datetime.now() - timedelta(seconds=ttl)
+    # Sessions are inserted in creation order, so expired ones are at the front
+    expired = [
+        request_id
+        for request_id, _ in takewhile(
+            lambda item: item[1]["created_at"] < cutoff,
+            behavioral_validation_sessions.items(),
+        )
+    ]
+    for request_id in expired:
+        del behavioral_validation_sessions[request_id]
+    return len(expired)
+
+
+async def _session_sweeper_loop():
+    """Periodically evict behavioral sessions past the session TTL."""
+    settings = get_settings()
+    while True:
+        await asyncio.sleep(settings.session_sweep_interval)
+        evict_expired_behavioral_sessions(settings.session_ttl)
+
+
+# TTL for cached configuration endpoint payloads (seconds)
+CONFIG_CACHE_TTL = 3600
+
+# Constant config payloads already served by this process, keyed like their
+# Redis entries. Only memoized keys land here and an explicit reload clears them.
+_local_json_cache: dict[str, bytes] = {}
+
+
+async def cached_json(
+    redis_client: aioredis.Redis,
+    key: str,
+    ttl: int,
+    compute: Callable[[], Any],
+    memoize: bool = False,
+) -> Response:
+    """Serve a JSON payload from memory or Redis, computing and storing it on a miss.
+
+    Only ``memoize`` payloads are kept in process memory; use it for a fixed
+    set of keys, never for keys built from request input.
+    """
+    body = _local_json_cache.get(key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    try:
+        body = await redis_client.get(key)
+    except aioredis.RedisError:
+        body = None
+        redis_client = None  # Redis unavailable: compute without caching
+
+    if body is None:
+        body = orjson.dumps(compute())
+        if redis_client is not None:
+            try:
+                await redis_client.set(key, body, ex=ttl)
+            except aioredis.RedisError:
+                pass
+
+    if memoize:
+        _local_json_cache[key] = body
+    return Response(content=body, media_type="application/json")
+
+
+@functools.lru_cache(maxsize=1)
+def _timestamp_for_second(second: int) -> str:
+    """Format a Unix second once; /health calls within that second reuse it."""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _request_id_timestamp() -> str:
+    """UTC timestamp with microseconds for the readable part of request IDs."""
+    return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S%f")
+
+
+# Report formats accepted as a query parameter, validated before the handler runs
+ReportFormat = Literal["json", "html", "markdown"]
+
+# Media type and download extension for each report format
+REPORT_MEDIA_TYPES = {
+    "json": ("application/json", "json"),
+    "html": ("text/html", "html"),
+    "markdown": ("text/markdown", "md"),
+}
+
+async def iter_bytes(data: bytes) -> AsyncIterator[bytes]:
+    """Yield data as a single chunk, for streaming in-memory content."""
+    yield data
+
+
+async def gunzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Decompress a stream of gzip chunks incrementally."""
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        yield decompressor.decompress(chunk)
+    yield decompressor.flush()
+
+
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+
+def _copy_upload(src, dest, size: int) -> None:
+    """Copy an upload's spooled file into dest without reading it into one bytes object.
+
+    Uploads Starlette has already rolled over to disk are copied kernel-side
+    with os.sendfile; in-memory ones go through shutil.copyfileobj in chunks.
+    """
+    if getattr(src, "_rolled", False) and hasattr(os, "sendfile"):
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dest.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError:
+            # Platform cannot sendfile between regular files; start over below
+            dest.seek(0)
+            dest.truncate()
+
+    src.seek(0)
+    shutil.copyfileobj(src, dest, UPLOAD_CHUNK_SIZE)
+
+
+def _copy_upload_limited(src, dest, max_size: int, filename: str) -> None:
+    """Copy an upload of unknown size into dest in chunks, stopping past max_size.
+
+    Raises ValueError as soon as more than max_size bytes have been read.
+    """
+    src.seek(0)
+    size = 0
+    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            raise ValueError(f"File too large: {filename} (over {max_size} bytes)")
+        dest.write(chunk)
+
+
+def _remove_quietly(path: str) -> None:
+    """Remove a file, ignoring errors if it is already gone."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+async def spool_upload(file: UploadFile, upload_dir: str, max_file_size: int) -> str:
+    """Copy one uploaded file to a temporary file in upload_dir and return its path.
+
+    Raises ValueError if the file exceeds max_file_size; the partial copy is
+    removed.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=upload_dir, suffix=".part", delete=False
+    ) as tmp:
+        try:
+            # Copies run on a worker thread so neither reads nor writes
+            # block the event loop, whether or not the upload is in memory
+            if file.size is not None:
+                await asyncio.to_thread(_copy_upload, file.file, tmp, file.size)
+            else:
+                # Size unknown: copy in chunks so oversized files stop early
+                await asyncio.to_thread(
+                    _copy_upload_limited,
+                    file.file,
+                    tmp,
+                    max_file_size,
+                    file.filename,
+                )
+            return tmp.name
+        except BaseException:
+            tmp.close()
+            _remove_quietly(tmp.name)
+            raise
+
+
+async def spool_uploads(
+    files: list[UploadFile],
+    upload_dir: str,
+    max_file_size: int,
+) -> list[tuple[str, str]]:
+    """Copy uploaded files to temporary files in upload_dir concurrently.
+
+    Returns (filename, spooled_path) pairs for every file that has a name.
+    Raises ValueError if any file exceeds max_file_size; known sizes are
+    checked before anything is copied, and on failure every spooled file
+    is removed.
+    """
+    named = [file for file in files if file.filename]
+    for file in named:
+        if file.size is not None and file.size > max_file_size:
+            raise ValueError(
+                f"File too large: {file.filename} (over {max_file_size} bytes)"
+            )
+
+    results = await asyncio.gather(
+        *(spool_upload(file, upload_dir, max_file_size) for file in named),
+        return_exceptions=True,
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        for result in results:
+            if isinstance(result, str):
+                _remove_quietly(result)
+        raise errors[0]
+
+    return [(file.filename, path) for file, path in zip(named, results)]
+
+
+# Limits concurrent in-process validations; created on first use from settings
+_validation_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def bounded_validation(func: Callable) -> Callable:
+    """Run a background validation only while a concurrency slot is free.
+
+    Bursts of requests queue here instead of starting unbounded crews and
+    LLM calls at once. The slot count is ``max_concurrent_validations``.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        global _validation_semaphore
+        if _validation_semaphore is None:
+            _validation_semaphore = asyncio.Semaphore(
+                get_settings().max_concurrent_validations
+            )
+        async with _validation_semaphore:
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+# Shared service instances, created on first use by the dependency providers
+_validator: Optional[MigrationValidator] = None
+_input_processor: Optional[InputProcessor] = None
+
+
+async def get_validator(request: Request) -> MigrationValidator:
+    """FastAPI dependency returning the process-wide MigrationValidator.
+
+    Its LLM service uses the app's shared HTTP client, so connections are
+    reused by every request and background validation.
+    """
+    global _validator
+    if _validator is None:
+        _validator = MigrationValidator(http_client=request.app.state.http)
+    return _validator
+
+
+async def get_input_processor() -> InputProcessor:
+    """FastAPI dependency returning the process-wide InputProcessor."""
+    global _input_processor
+    if _input_processor is None:
+        _input_processor = InputProcessor()
+    return _input_processor
+
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
@@ -91,6 +439,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS
@@ -101,10 +450,47 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Compress large JSON/HTML responses; pre-compressed reports pass through
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    @app.on_event("startup")
+    async def configure_threadpool():
+        """Size the AnyIO threadpool used by sync endpoints and dependencies."""
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = get_settings().threadpool_size
+
+    @app.on_event("startup")
+    async def open_http_client():
+        """Create the HTTP client shared by LLM provider calls."""
+        app.state.http = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+    @app.on_event("shutdown")
+    async def close_http_client():
+        """Close the shared HTTP client and its pooled connections."""
+        await app.state.http.aclose()
+
+    @app.on_event("startup")
+    async def start_session_sweeper():
+        """Start evicting behavioral sessions that clients never deleted."""
+        global _session_sweeper_task
+        if _session_sweeper_task is None or _session_sweeper_task.done():
+            _session_sweeper_task = asyncio.create_task(_session_sweeper_loop())
+
+    @app.on_event("shutdown")
+    async def stop_session_sweeper():
+        """Cancel the behavioral session sweeper."""
+        global _session_sweeper_task
+        if _session_sweeper_task is not None:
+            _session_sweeper_task.cancel()
+            _session_sweeper_task = None
 
     # Initialize components
-    validator = MigrationValidator()
-    input_processor = InputProcessor()
+    session_store = ValidationSessionStore()
+    # Config payloads only change with a deploy, so the app version scopes cache keys
+    cache_prefix = f"cap:{app.version}"
 
     # Hardcoded user for demonstration (replace with database lookup in production)
     HARDCODED_USER = {
@@ -116,7 +502,7 @@ def create_app() -> FastAPI:
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
     async def get_current_user(token: str = Depends(oauth2_scheme)):
-        payload = decode_access_token(token)
+        payload = decode_access_token_cached(token)
         if payload is None:
             raise HTTPException(status_code=401, detail="Invalid token")
         username = payload.get("sub")
@@ -125,6 +511,39 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=401, detail="Invalid token payload")
         return {"username": username, "role": user_role}
 
+    async def save_upload_groups(
+        groups: dict[str, list[UploadFile]], input_processor: InputProcessor
+    ) -> dict[str, list[str]]:
+        """Stream several groups of uploads to disk in one batch.
+
+        Files are spooled concurrently and moved into their context
+        directories only once every file in every group has been accepted.
+        """
+        named = {
+            context: [file for file in files if file.filename]
+            for context, files in groups.items()
+        }
+        spooled = await spool_uploads(
+            [file for files in named.values() for file in files],
+            input_processor.upload_dir,
+            input_processor.max_file_size,
+        )
+
+        # spool_uploads keeps input order, so split the results back by group
+        spooled_groups = {}
+        offset = 0
+        for context, files in named.items():
+            spooled_groups[context] = spooled[offset : offset + len(files)]
+            offset += len(files)
+
+        return input_processor.upload_path_groups(spooled_groups)
+
+    async def save_uploads(
+        files: list[UploadFile], context: str, input_processor: InputProcessor
+    ) -> list[str]:
+        """Stream uploads to disk and move them into the upload directory."""
+        return (await save_upload_groups({context: files}, input_processor))[context]
+
     def has_role(required_role: UserRole):
         def role_checker(current_user: dict[str, Any] = Depends(get_current_user)):
             if current_user["role"] != required_role:
@@ -136,7 +555,10 @@ def create_app() -> FastAPI:
     @app.post("/token", response_model=Token, tags=["Authentication"])
     async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
         user = HARDCODED_USER  # In production, fetch user from DB
-        if not user or not verify_password(form_data.password, user["password"]):
+        # bcrypt verification takes tens of milliseconds; keep it off the event loop
+        if not user or not await asyncio.to_thread(
+            verify_password, form_data.password, user["password"]
+        ):
             raise HTTPException(
                 status_code=401,
                 detail="Incorrect username or password",
@@ -165,7 +587,7 @@ def create_app() -> FastAPI:
         """Detailed health check."""
         return {
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp_for_second(int(time.time())),
             "services": {"validator": "operational", "input_processor": "operational"},
         }
 
@@ -174,11 +596,20 @@ def create_app() -> FastAPI:
         response_model=TechnologyOptionsResponse,
         tags=["Configuration"],
     )
-    async def get_technology_options():
+    async def get_technology_options(
+        input_processor: InputProcessor = Depends(get_input_processor),
+    ):
         """Get available technology options for validation."""
         try:
-            options = input_processor.get_technology_options()
-            return TechnologyOptionsResponse(**options)
+            return await cached_json(
+                session_store.redis,
+                f"{cache_prefix}:tech_options",
+                CONFIG_CACHE_TTL,
+                lambda: TechnologyOptionsResponse(
+                    **input_processor.get_technology_options()
+                ).model_dump(),
+                memoize=True,
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -190,15 +621,25 @@ def create_app() -> FastAPI:
         response_model=CompatibilityCheckResponse,
         tags=["Configuration"],
     )
-    async def check_compatibility(request: CompatibilityCheckRequest):
+    async def check_compatibility(
+        request: CompatibilityCheckRequest,
+        input_processor: InputProcessor = Depends(get_input_processor),
+    ):
         """Check compatibility between source and target technologies."""
         try:
-            result = input_processor.validate_technology_compatibility(
-                request.source_technology,
-                request.target_technology,
-                request.validation_scope,
+            return await cached_json(
+                session_store.redis,
+                f"{cache_prefix}:compat:{request.source_technology}"
+                f":{request.target_technology}:{request.validation_scope}",
+                CONFIG_CACHE_TTL,
+                lambda: CompatibilityCheckResponse(
+                    **input_processor.validate_technology_compatibility(
+                        request.source_technology,
+                        request.target_technology,
+                        request.validation_scope,
+                    )
+                ).model_dump(),
             )
-            return CompatibilityCheckResponse(**result)
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Compatibility check failed: {e!s}"
@@ -209,35 +650,54 @@ def create_app() -> FastAPI:
         tags=["Configuration"],
         dependencies=[Depends(has_role(UserRole.ADMIN))],
     )
-    async def get_system_capabilities():
+    async def get_system_capabilities(
+        validator: MigrationValidator = Depends(get_validator),
+    ):
         """Get system capabilities and supported features."""
         try:
-            capabilities = validator.get_supported_technologies()
-            return capabilities
+            return await cached_json(
+                session_store.redis,
+                f"{cache_prefix}:system",
+                CONFIG_CACHE_TTL,
+                validator.get_supported_technologies,
+                memoize=True,
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Failed to get capabilities: {e!s}"
             )
 
-    @app.post("/api/upload/source", tags=["File Management"])
-    async def upload_source_files(files: list[UploadFile] = File(...)):
-        """Upload source system files for validation."""
-        try:
-            uploaded_files = []
-            for file in files:
-                if not file.filename:
-                    continue
+    @app.post(
+        "/api/admin/config-cache/reload",
+        tags=["Configuration"],
+        dependencies=[Depends(has_role(UserRole.ADMIN))],
+    )
+    async def reload_config_cache():
+        """Drop cached technology options, capabilities and compatibility checks.
 
-                contents = await file.read()
-                uploaded_files.append((file.filename, contents))
+        Clears the shared Redis entries and this worker's in-memory copies,
+        including idle behavioral crews; other workers keep theirs until they
+        restart.
+        """
+        _local_json_cache.clear()
+        behavioral_crews.clear()
+        deleted = 0
+        async for key in session_store.redis.scan_iter(match=f"{cache_prefix}:*"):
+            deleted += await session_store.redis.delete(key)
+        return {"message": "Configuration cache cleared", "redis_keys_deleted": deleted}
+
+    async def upload_files(
+        files: list[UploadFile], bucket: str, input_processor: InputProcessor
+    ) -> dict[str, Any]:
+        """Save uploaded files for one side of a migration and describe them."""
+        try:
+            saved_paths = await save_uploads(files, bucket, input_processor)
 
-            if not uploaded_files:
+            if not saved_paths:
                 raise HTTPException(status_code=400, detail="No valid files uploaded")
 
-            saved_paths = input_processor.upload_files(uploaded_files, "source")
-
             return {
-                "message": f"Successfully uploaded {len(saved_paths)} source files",
+                "message": f"Successfully uploaded {len(saved_paths)} {bucket} files",
                 "files": [
                     {"filename": os.path.basename(path), "path": path}
                     for path in saved_paths
@@ -249,126 +709,60 @@ def create_app() -> FastAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Upload failed: {e!s}")
 
+    @app.post("/api/upload/source", tags=["File Management"])
+    async def upload_source_files(
+        files: list[UploadFile] = File(...),
+        input_processor: InputProcessor = Depends(get_input_processor),
+    ):
+        """Upload source system files for validation."""
+        return await upload_files(files, "source", input_processor)
+
     @app.post("/api/upload/target", tags=["File Management"])
-    async def upload_target_files(files: list[UploadFile] = File(...)):
+    async def upload_target_files(
+        files: list[UploadFile] = File(...),
+        input_processor: InputProcessor = Depends(get_input_processor),
+    ):
         """Upload target system files for validation."""
-        try:
-            uploaded_files = []
-            for file in files:
-                if not file.filename:
-                    continue
-
-                contents = await file.read()
-                uploaded_files.append((file.filename, contents))
-
-            if not uploaded_files:
-                raise HTTPException(status_code=400, detail="No valid files uploaded")
-
-            saved_paths = input_processor.upload_files(uploaded_files, "target")
-
-            return {
-                "message": f"Successfully uploaded {len(saved_paths)} target files",
-                "files": [
-                    {"filename": os.path.basename(path), "path": path}
-                    for path in saved_paths
-                ],
-            }
-
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Upload failed: {e!s}")
+        return await upload_files(files, "target", input_processor)
 
     @app.post("/api/validate", tags=["Validation"])
     async def validate_migration(
-        background_tasks: BackgroundTasks,
         request_data: str = Form(...),
         source_files: list[UploadFile] = File(default=[]),
         source_screenshots: list[UploadFile] = File(default=[]),
         target_files: list[UploadFile] = File(default=[]),
         target_screenshots: list[UploadFile] = File(default=[]),
+        validator: MigrationValidator = Depends(get_validator),
+        input_processor: InputProcessor = Depends(get_input_processor),
     ):
         """Execute migration validation with uploaded files.
 
-        This endpoint handles file uploads and starts validation process in background.
+        This endpoint handles file uploads and queues the validation on a worker.
         """
         try:
-            # Parse request data
-            import json
-
-            validation_req = ValidationRequest(**json.loads(request_data))
-
-            # Process uploaded files
-            source_file_paths = []
-            source_screenshot_paths = []
-            target_file_paths = []
-            target_screenshot_paths = []
-
-            # Handle source files
-            if source_files:
-                source_uploaded = []
-                for file in source_files:
-                    if file.filename:
-                        contents = await file.read()
-                        source_uploaded.append((file.filename, contents))
-
-                if source_uploaded:
-                    source_file_paths = input_processor.upload_files(
-                        source_uploaded,
-                        "source_validation",
-                    )
-
-            # Handle source screenshots
-            if source_screenshots:
-                source_screenshot_uploaded = []
-                for file in source_screenshots:
-                    if file.filename:
-                        contents = await file.read()
-                        source_screenshot_uploaded.append((file.filename, contents))
-
-                if source_screenshot_uploaded:
-                    source_screenshot_paths = input_processor.upload_files(
-                        source_screenshot_uploaded,
-                        "source_screenshots",
-                    )
-
-            # Handle target files
-            if target_files:
-                target_uploaded = []
-                for file in target_files:
-                    if file.filename:
-                        contents = await file.read()
-                        target_uploaded.append((file.filename, contents))
-
-                if target_uploaded:
-                    target_file_paths = input_processor.upload_files(
-                        target_uploaded,
-                        "target_validation",
-                    )
+            # Parse and validate request data in one pass
+            validation_req = ValidationRequest.model_validate_json(request_data)
 
-            # Handle target screenshots
-            if target_screenshots:
-                target_screenshot_uploaded = []
-                for file in target_screenshots:
-                    if file.filename:
-                        contents = await file.read()
-                        target_screenshot_uploaded.append((file.filename, contents))
-
-                if target_screenshot_uploaded:
-                    target_screenshot_paths = input_processor.upload_files(
-                        target_screenshot_uploaded,
-                        "target_screenshots",
-                    )
+            # Save the four upload groups in one batch
+            upload_paths = await save_upload_groups(
+                {
+                    "source_validation": source_files,
+                    "source_screenshots": source_screenshots,
+                    "target_validation": target_files,
+                    "target_screenshots": target_screenshots,
+                },
+                input_processor,
+            )
 
             # Create validation request
             migration_request = input_processor.create_validation_request(
                 source_technology=validation_req.source_technology,
                 target_technology=validation_req.target_technology,
                 validation_scope=validation_req.validation_scope,
-                source_files=source_file_paths,
-                source_screenshots=source_screenshot_paths,
-                target_files=target_file_paths,
-                target_screenshots=target_screenshot_paths,
+                source_files=upload_paths["source_validation"],
+                source_screenshots=upload_paths["source_screenshots"],
+                target_files=upload_paths["target_validation"],
+                target_screenshots=upload_paths["target_screenshots"],
                 source_tech_version=validation_req.source_tech_version,
                 target_tech_version=validation_req.target_tech_version,
                 metadata=validation_req.metadata,
@@ -386,18 +780,17 @@ def create_app() -> FastAPI:
                     },
                 )
 
-            # Start validation in background
-            background_tasks.add_task(
-                run_validation_background,
-                migration_request.request_id,
-                migration_request,
-                validator,
-            )
-
             # Store initial session
             session = ValidationSession(request=migration_request)
             session.add_log("Validation request received and queued for processing")
-            validation_sessions[migration_request.request_id] = session
+            await session_store.save(migration_request.request_id, session)
+
+            # Queue validation on a Celery worker; publishing is blocking I/O
+            await asyncio.to_thread(
+                run_validation_job.delay,
+                migration_request.request_id,
+                migration_request.to_dict(),
+            )
 
             return {
                 "request_id": migration_request.request_id,
@@ -406,8 +799,11 @@ def create_app() -> FastAPI:
                 "warnings": validation_check.get("warnings", []),
             }
 
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON in request data")
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=e.errors(include_url=False, include_context=False),
+            )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
@@ -420,29 +816,14 @@ def create_app() -> FastAPI:
     )
     async def get_validation_status(request_id: str):
         """Get validation status and progress."""
-        if request_id not in validation_sessions:
+        # Reads only the status snapshot, not the full session
+        snapshot = await session_store.get_status(request_id)
+        if snapshot is None:
             raise HTTPException(status_code=404, detail="Validation request not found")
 
-        session = validation_sessions[request_id]
-
-        # Determine status
-        if session.result is None:
-            status = "processing"
-            progress = f"Processing step: {len(session.processing_log)}"
-        elif session.result.overall_status == "error":
-            status = "error"
-            progress = None
-        else:
-            status = "completed"
-            progress = "Validation completed"
-
-        return ValidationStatusResponse(
-            request_id=request_id,
-            status=status,
-            progress=progress,
-            message=session.processing_log[-1] if session.processing_log else None,
-            result_available=session.result is not None,
-        )
+        # The snapshot already has the response shape; returning a Response
+        # skips building and re-validating the response model on every poll
+        return ORJSONResponse({"request_id": request_id, **snapshot})
 
     @app.get(
         "/api/validate/{request_id}/result",
@@ -451,76 +832,76 @@ def create_app() -> FastAPI:
     )
     async def get_validation_result(request_id: str):
         """Get validation results."""
-        if request_id not in validation_sessions:
-            raise HTTPException(status_code=404, detail="Validation request not found")
-
-        session = validation_sessions[request_id]
-
-        if session.result is None:
+        result = await session_store.get_result(request_id)
+        if result is None:
+            if await session_store.get_status(request_id) is None:
+                raise HTTPException(
+                    status_code=404, detail="Validation request not found"
+                )
             raise HTTPException(status_code=202, detail="Validation still in progress")
 
-        if session.result.overall_status == "error":
-            raise HTTPException(status_code=500, detail=session.result.summary)
-
-        # Count discrepancies
-        discrepancy_counts = {"critical": 0, "warning": 0, "info": 0}
-        for discrepancy in session.result.discrepancies:
-            discrepancy_counts[discrepancy.severity.value] += 1
+        if result["overall_status"] == "error":
+            raise HTTPException(status_code=500, detail=result["summary"])
 
-        return ValidationResultResponse(
-            request_id=request_id,
-            overall_status=session.result.overall_status,
-            fidelity_score=session.result.fidelity_score,
-            fidelity_percentage=f"{session.result.fidelity_score * 100:.1f}%",
-            summary=session.result.summary,
-            discrepancy_counts=discrepancy_counts,
-            execution_time=session.result.execution_time,
-            timestamp=session.result.timestamp.isoformat(),
+        return ORJSONResponse(
+            {
+                "request_id": request_id,
+                "fidelity_percentage": f"{result['fidelity_score'] * 100:.1f}%",
+                **result,
+            }
         )
 
     @app.get("/api/validate/{request_id}/report", tags=["Reports"])
-    async def get_validation_report(request_id: str, format: str = "json"):
+    async def get_validation_report(
+        request: Request,
+        request_id: str,
+        format: ReportFormat = "json",
+        validator: MigrationValidator = Depends(get_validator),
+    ):
         """Get detailed validation report.
 
         Args:
+            request: Incoming request, checked for gzip support
             request_id: Validation request ID
             format: Report format (json, html, markdown)
 
         """
-        if request_id not in validation_sessions:
-            raise HTTPException(status_code=404, detail="Validation request not found")
+        cached = await session_store.report_size(request_id, format) > 0
 
-        session = validation_sessions[request_id]
+        if not cached:
+            session = await session_store.get(request_id)
+            if session is None:
+                raise HTTPException(
+                    status_code=404, detail="Validation request not found"
+                )
 
-        if session.result is None:
-            raise HTTPException(status_code=202, detail="Validation still in progress")
+            if session.result is None:
+                raise HTTPException(
+                    status_code=202, detail="Validation still in progress"
+                )
 
         try:
-            report_content = await validator.generate_report(session, format)
-
-            if format.lower() == "html":
-                return PlainTextResponse(
-                    content=report_content,
-                    media_type="text/html",
-                    headers={
-                        "Content-Disposition": f"attachment; filename=validation_report_{request_id}.html",
-                    },
+            if cached:
+                chunks = session_store.iter_report(request_id, format)
+            else:
+                report_content = await validator.generate_report(session, format)
+                chunks = iter_bytes(
+                    await session_store.save_report(request_id, format, report_content)
                 )
-            if format.lower() == "markdown":
-                return PlainTextResponse(
-                    content=report_content,
-                    media_type="text/markdown",
-                    headers={
-                        "Content-Disposition": f"attachment; filename=validation_report_{request_id}.md",
-                    },
-                )
-            # JSON
-            return JSONResponse(
-                content=json.loads(report_content),
-                headers={
-                    "Content-Disposition": f"attachment; filename=validation_report_{request_id}.json",
-                },
-            )
+
+            media_type, extension = REPORT_MEDIA_TYPES[format]
+            headers = {
+                "Content-Disposition": f"attachment; filename=validation_report_{request_id}.{extension}",
+                "Vary": "Accept-Encoding",
+            }
+
+            # Reports are cached gzipped; stream them as-is to clients that accept it
+            if "gzip" in request.headers.get("accept-encoding", ""):
+                headers["Content-Encoding"] = "gzip"
+            else:
+                chunks = gunzip_chunks(chunks)
+
+            return StreamingResponse(chunks, media_type=media_type, headers=headers)
 
         except Exception as e:
             raise HTTPException(
@@ -528,67 +909,52 @@ def create_app() -> FastAPI:
             )
 
     @app.get("/api/validate/{request_id}/logs", tags=["Validation"])
-    async def get_validation_logs(request_id: str):
-        """Get validation processing logs."""
-        if request_id not in validation_sessions:
+    async def get_validation_logs(request_id: str, since: int = Query(0, ge=0)):
+        """Get validation processing logs, skipping the first ``since`` entries."""
+        session = await session_store.get(request_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Validation request not found")
 
-        session = validation_sessions[request_id]
-
         return {
             "request_id": request_id,
-            "logs": session.processing_log,
-            "log_count": len(session.processing_log),
+            "logs": session.processing_log[since:],
+            "log_count": session.log_count,
         }
 
     @app.delete("/api/validate/{request_id}", tags=["Validation"])
-    async def delete_validation_session(request_id: str):
+    async def delete_validation_session(
+        request_id: str,
+        input_processor: InputProcessor = Depends(get_input_processor),
+    ):
         """Delete validation session and clean up files."""
-        if request_id not in validation_sessions:
+        session = await session_store.get(request_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Validation request not found")
 
-        session = validation_sessions[request_id]
-
         # Clean up uploaded files
-        all_files = (
-            session.request.source_input.files
-            + session.request.source_input.screenshots
-            + session.request.target_input.files
-            + session.request.target_input.screenshots
+        all_files = chain(
+            session.request.source_input.files,
+            session.request.source_input.screenshots,
+            session.request.target_input.files,
+            session.request.target_input.screenshots,
         )
 
         input_processor.cleanup_uploads(all_files)
 
         # Remove session
-        del validation_sessions[request_id]
+        await session_store.delete(request_id)
 
         return {"message": f"Validation session {request_id} deleted successfully"}
 
     @app.get("/api/validate", tags=["Validation"])
-    async def list_validation_sessions():
-        """List all validation sessions."""
-        sessions_info = []
-
-        for request_id, session in validation_sessions.items():
-            status = "completed" if session.result else "processing"
-            if session.result and session.result.overall_status == "error":
-                status = "error"
-
-            sessions_info.append(
-                {
-                    "request_id": request_id,
-                    "status": status,
-                    "created_at": session.request.created_at.isoformat(),
-                    "source_technology": session.request.source_technology.type.value,
-                    "target_technology": session.request.target_technology.type.value,
-                    "validation_scope": session.request.validation_scope.value,
-                    "fidelity_score": (
-                        session.result.fidelity_score if session.result else None
-                    ),
-                },
-            )
+    async def list_validation_sessions(
+        limit: int = Query(50, ge=1, le=500),
+        offset: int = Query(0, ge=0),
+    ):
+        """List validation sessions, newest first."""
+        sessions_info, total_count = await session_store.list_summaries(offset, limit)
 
-        return {"sessions": sessions_info, "total_count": len(sessions_info)}
+        return {"sessions": sessions_info, "total_count": total_count}
 
     @app.post("/api/behavioral/validate", tags=["Behavioral Validation"])
     async def start_behavioral_validation(
@@ -602,7 +968,7 @@ def create_app() -> FastAPI:
         """
         try:
             # Generate unique request ID
-            request_id = f"behavioral_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(request.source_url + request.target_url) % 10000:04d}"
+            request_id = f"behavioral_{_request_id_timestamp()}_{secrets.token_hex(4)}"
 
             # Create behavioral validation request
             behavioral_request = BehavioralValidationRequest(
@@ -615,14 +981,20 @@ def create_app() -> FastAPI:
             )
 
             # Initialize session tracking
-            behavioral_validation_sessions[request_id] = {
-                "request": behavioral_request,
-                "status": "pending",
-                "created_at": datetime.now(),
-                "progress": "Behavioral validation queued for processing",
-                "result": None,
-                "logs": ["Behavioral validation request received and queued"],
-            }
+            track_behavioral_session(
+                request_id,
+                {
+                    "request": behavioral_request,
+                    "status": "pending",
+                    "created_at": datetime.now(),
+                    "progress": "Behavioral validation queued for processing",
+                    "result": None,
+                    "logs": deque(
+                        ["Behavioral validation request received and queued"],
+                        maxlen=BEHAVIORAL_LOG_LIMIT,
+                    ),
+                },
+            )
 
             # Start validation in background
             background_tasks.add_task(
@@ -651,13 +1023,12 @@ def create_app() -> FastAPI:
     )
     async def get_behavioral_validation_status(request_id: str):
         """Get behavioral validation status and progress."""
-        if request_id not in behavioral_validation_sessions:
+        session = behavioral_validation_sessions.get(request_id)
+        if session is None:
             raise HTTPException(
                 status_code=404, detail="Behavioral validation request not found"
             )
 
-        session = behavioral_validation_sessions[request_id]
-
         return BehavioralValidationStatusResponse(
             request_id=request_id,
             status=session["status"],
@@ -673,13 +1044,12 @@ def create_app() -> FastAPI:
     )
     async def get_behavioral_validation_result(request_id: str):
         """Get behavioral validation results."""
-        if request_id not in behavioral_validation_sessions:
+        session = behavioral_validation_sessions.get(request_id)
+        if session is None:
             raise HTTPException(
                 status_code=404, detail="Behavioral validation request not found"
             )
 
-        session = behavioral_validation_sessions[request_id]
-
         if session["result"] is None:
             raise HTTPException(
                 status_code=202, detail="Behavioral validation still in progress"
@@ -690,27 +1060,12 @@ def create_app() -> FastAPI:
         if result.overall_status == "error":
             raise HTTPException(status_code=500, detail="Behavioral validation failed")
 
-        # Convert discrepancies to dictionary format for JSON serialization
-        discrepancies_dict = []
-        for discrepancy in result.discrepancies:
-            discrepancies_dict.append(
-                {
-                    "type": discrepancy.type,
-                    "severity": discrepancy.severity.value,
-                    "description": discrepancy.description,
-                    "source_element": discrepancy.source_element,
-                    "target_element": discrepancy.target_element,
-                    "recommendation": discrepancy.recommendation,
-                    "confidence": discrepancy.confidence,
-                },
-            )
-
         return BehavioralValidationResultResponse(
             request_id=request_id,
             overall_status=result.overall_status,
             fidelity_score=result.fidelity_score,
             fidelity_percentage=f"{result.fidelity_score * 100:.1f}%",
-            discrepancies=discrepancies_dict,
+            discrepancies=session["discrepancies"],
             execution_time=result.execution_time,
             timestamp=result.timestamp.isoformat(),
         )
@@ -723,6 +1078,8 @@ def create_app() -> FastAPI:
         source_screenshots: list[UploadFile] = File(default=[]),
         target_files: list[UploadFile] = File(default=[]),
         target_screenshots: list[UploadFile] = File(default=[]),
+        validator: MigrationValidator = Depends(get_validator),
+        input_processor: InputProcessor = Depends(get_input_processor),
     ):
         """Execute hybrid validation combining static analysis and behavioral testing.
 
@@ -730,13 +1087,11 @@ def create_app() -> FastAPI:
         validation, providing a comprehensive migration assessment.
         """
         try:
-            # Parse request data
-            import json
-
-            hybrid_request = HybridValidationRequest(**json.loads(request_data))
+            # Parse and validate request data in one pass
+            hybrid_request = HybridValidationRequest.model_validate_json(request_data)
 
             # Generate unique request ID for hybrid validation
-            request_id = f"hybrid_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(str(hybrid_request.dict())) % 10000:04d}"
+            request_id = f"hybrid_{_request_id_timestamp()}_{secrets.token_hex(4)}"
 
             # Determine validation types to perform
             perform_static = bool(
@@ -755,12 +1110,34 @@ def create_app() -> FastAPI:
                     detail="Either static files/screenshots or behavioral URLs must be provided",
                 )
 
+            # Stream uploads to disk now; UploadFiles are closed once we respond
+            upload_paths = {}
+            if perform_static:
+                saved = await save_upload_groups(
+                    {
+                        "hybrid_source": source_files,
+                        "hybrid_source_screenshots": source_screenshots,
+                        "hybrid_target": target_files,
+                        "hybrid_target_screenshots": target_screenshots,
+                    },
+                    input_processor,
+                )
+                upload_paths = {
+                    "source_files": saved["hybrid_source"],
+                    "source_screenshots": saved["hybrid_source_screenshots"],
+                    "target_files": saved["hybrid_target"],
+                    "target_screenshots": saved["hybrid_target_screenshots"],
+                }
+
             # Initialize hybrid session tracking
-            validation_sessions[request_id] = ValidationSession(
-                request=None,  # Will be populated during processing
-                processing_log=[
-                    f"Hybrid validation started - Static: {perform_static}, Behavioral: {perform_behavioral}",
-                ],
+            await session_store.save(
+                request_id,
+                ValidationSession(
+                    request=None,  # Will be populated during processing
+                    processing_log=[
+                        f"Hybrid validation started - Static: {perform_static}, Behavioral: {perform_behavioral}",
+                    ],
+                ),
             )
 
             # Start hybrid validation in background
@@ -768,16 +1145,12 @@ def create_app() -> FastAPI:
                 run_hybrid_validation_background,
                 request_id,
                 hybrid_request,
-                {
-                    "source_files": source_files,
-                    "source_screenshots": source_screenshots,
-                    "target_files": target_files,
-                    "target_screenshots": target_screenshots,
-                },
+                upload_paths,
                 perform_static,
                 perform_behavioral,
                 validator,
                 input_processor,
+                session_store,
             )
 
             return {
@@ -790,8 +1163,11 @@ def create_app() -> FastAPI:
                 },
             }
 
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON in request data")
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=e.errors(include_url=False, include_context=False),
+            )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
@@ -800,57 +1176,56 @@ def create_app() -> FastAPI:
             )
 
     @app.get("/api/behavioral/{request_id}/logs", tags=["Behavioral Validation"])
-    async def get_behavioral_validation_logs(request_id: str):
-        """Get behavioral validation processing logs."""
-        if request_id not in behavioral_validation_sessions:
+    async def get_behavioral_validation_logs(
+        request_id: str, since: int = Query(0, ge=0)
+    ):
+        """Get behavioral validation processing logs.
+
+        Only the most recent BEHAVIORAL_LOG_LIMIT entries are kept; ``since``
+        skips entries a polling client has already seen.
+        """
+        session = behavioral_validation_sessions.get(request_id)
+        if session is None:
             raise HTTPException(
                 status_code=404, detail="Behavioral validation request not found"
             )
 
-        session = behavioral_validation_sessions[request_id]
-
         return {
             "request_id": request_id,
-            "logs": session["logs"],
+            "logs": list(islice(session["logs"], since, None)),
             "log_count": len(session["logs"]),
         }
 
     @app.delete("/api/behavioral/{request_id}", tags=["Behavioral Validation"])
     async def delete_behavioral_validation_session(request_id: str):
         """Delete behavioral validation session and clean up resources."""
-        if request_id not in behavioral_validation_sessions:
+        # Remove session
+        if behavioral_validation_sessions.pop(request_id, None) is None:
             raise HTTPException(
                 status_code=404, detail="Behavioral validation request not found"
             )
 
-        # Remove session
-        del behavioral_validation_sessions[request_id]
-
         return {
             "message": f"Behavioral validation session {request_id} deleted successfully"
         }
 
     @app.get("/api/behavioral", tags=["Behavioral Validation"])
-    async def list_behavioral_validation_sessions():
-        """List all behavioral validation sessions."""
-        sessions_info = []
-
-        for request_id, session in behavioral_validation_sessions.items():
-            sessions_info.append(
-                {
-                    "request_id": request_id,
-                    "status": session["status"],
-                    "created_at": session["created_at"].isoformat(),
-                    "source_url": session["request"].source_url,
-                    "target_url": session["request"].target_url,
-                    "scenarios_count": len(session["request"].validation_scenarios),
-                    "fidelity_score": (
-                        session["result"].fidelity_score if session["result"] else None
-                    ),
-                },
-            )
+    async def list_behavioral_validation_sessions(
+        limit: int = Query(50, ge=1, le=500),
+        offset: int = Query(0, ge=0),
+    ):
+        """List behavioral validation sessions in creation order."""
+        # Dicts keep insertion order, so only the requested page is summarized
+        page = islice(behavioral_validation_sessions.items(), offset, offset + limit)
+        sessions_info = [
+            behavioral_session_row(request_id, session)
+            for request_id, session in page
+        ]
 
-        return {"sessions": sessions_info, "total_count": len(sessions_info)}
+        return {
+            "sessions": sessions_info,
+            "total_count": len(behavioral_validation_sessions),
+        }
 
     # Include async processing routes
     app.include_router(async_router)
@@ -858,31 +1233,7 @@ def create_app() -> FastAPI:
     return app
 
 
-async def run_validation_background(
-    request_id: str,
-    migration_request,
-    validator: MigrationValidator,
-):
-    """Run validation in background task."""
-    try:
-        session = await validator.validate_migration(migration_request)
-        validation_sessions[request_id] = session
-    except Exception as e:
-        # Update session with error
-        if request_id in validation_sessions:
-            session = validation_sessions[request_id]
-            session.add_log(f"Validation failed: {e!s}")
-            # Create error result
-            from ..core.models import ValidationResult
-
-            session.result = ValidationResult(
-                overall_status="error",
-                fidelity_score=0.0,
-                summary=f"Validation failed: {e!s}",
-                discrepancies=[],
-            )
-
-
+@bounded_validation
 async def run_behavioral_validation_background(
     request_id: str,
     behavioral_request: BehavioralValidationRequest,
@@ -890,165 +1241,76 @@ async def run_behavioral_validation_background(
     """Run behavioral validation in background task."""
     try:
         # Update session status
-        if request_id in behavioral_validation_sessions:
-            behavioral_validation_sessions[request_id]["status"] = "processing"
-            behavioral_validation_sessions[request_id]["progress"] = (
-                "Initializing behavioral validation crew"
-            )
-            behavioral_validation_sessions[request_id]["logs"].append(
-                "Starting behavioral validation crew",
-            )
-
-        # Create behavioral validation crew
-        crew = create_behavioral_validation_crew()
-
-        # Update progress
-        if request_id in behavioral_validation_sessions:
-            behavioral_validation_sessions[request_id]["progress"] = (
-                "Executing behavioral validation scenarios"
-            )
-            behavioral_validation_sessions[request_id]["logs"].append(
-                "Behavioral validation crew initialized, starting validation",
-            )
+        session = behavioral_validation_sessions.get(request_id)
+        if session is not None:
+            session["status"] = "processing"
+            session["progress"] = "Initializing behavioral validation crew"
+            session["logs"].append("Starting behavioral validation crew")
+            # Status changed, so the cached listing row is stale
+            session.pop("row", None)
+
+        # Check out a behavioral validation crew
+        async with behavioral_crews.crew() as crew:
+            # Update progress
+            session = behavioral_validation_sessions.get(request_id)
+            if session is not None:
+                session["progress"] = "Executing behavioral validation scenarios"
+                session["logs"].append(
+                    "Behavioral validation crew initialized, starting validation",
+                )
 
-        # Execute behavioral validation
-        result = await crew.validate_migration(behavioral_request)
+            # Execute behavioral validation
+            result = await crew.validate_migration(behavioral_request)
 
         # Update session with results
-        if request_id in behavioral_validation_sessions:
-            behavioral_validation_sessions[request_id]["status"] = "completed"
-            behavioral_validation_sessions[request_id]["progress"] = (
-                "Behavioral validation completed"
-            )
-            behavioral_validation_sessions[request_id]["result"] = result
-            behavioral_validation_sessions[request_id]["logs"].append(
+        session = behavioral_validation_sessions.get(request_id)
+        if session is not None:
+            session["status"] = "completed"
+            session["progress"] = "Behavioral validation completed"
+            session["result"] = result
+            session["discrepancies"] = serialize_discrepancies(result.discrepancies)
+            session["logs"].append(
                 f"Behavioral validation completed with fidelity score: {result.fidelity_score:.2f}",
             )
+            session.pop("row", None)
 
     except Exception as e:
         # Update session with error
-        if request_id in behavioral_validation_sessions:
-            behavioral_validation_sessions[request_id]["status"] = "error"
-            behavioral_validation_sessions[request_id]["progress"] = (
-                f"Behavioral validation failed: {e!s}"
-            )
-            behavioral_validation_sessions[request_id]["logs"].append(
-                f"Behavioral validation error: {e!s}",
-            )
-
-            # Create error result
-            from ..behavioral.crews import BehavioralValidationResult
-
-            error_result = BehavioralValidationResult(
-                overall_status="error",
-                fidelity_score=0.0,
-                discrepancies=[
-                    ValidationDiscrepancy(
-                        type="behavioral_validation_error",
-                        severity=SeverityLevel.CRITICAL,
-                        description=f"Behavioral validation failed: {e!s}",
-                        recommendation="Review system configuration and retry validation",
-                    ),
-                ],
-                execution_log=[f"Error: {e!s}"],
-                execution_time=0.0,
-                timestamp=datetime.now(),
-            )
-            behavioral_validation_sessions[request_id]["result"] = error_result
+        session = behavioral_validation_sessions.get(request_id)
+        if session is not None:
+            record_behavioral_error(session, e)
 
 
+@bounded_validation
 async def run_hybrid_validation_background(
     request_id: str,
     hybrid_request: HybridValidationRequest,
-    uploaded_files: dict[str, list],
+    upload_paths: dict[str, list[str]],
     perform_static: bool,
     perform_behavioral: bool,
     validator: MigrationValidator,
     input_processor: InputProcessor,
+    session_store: ValidationSessionStore,
 ):
     """Run hybrid validation combining static and behavioral validation."""
+    session = None
     try:
-        session = validation_sessions[request_id]
+        session = await session_store.get(request_id)
         session.add_log("Starting hybrid validation process")
+        await session_store.save(request_id, session)
 
-        static_result = None
-        behavioral_result = None
-
-        # Perform static validation if files were provided
-        if perform_static:
+        async def run_static():
             session.add_log("Starting static validation component")
 
-            # Process uploaded files similar to the main validation endpoint
-            source_file_paths = []
-            source_screenshot_paths = []
-            target_file_paths = []
-            target_screenshot_paths = []
-
-            # Handle source files
-            if uploaded_files["source_files"]:
-                source_uploaded = []
-                for file in uploaded_files["source_files"]:
-                    if file.filename:
-                        contents = await file.read()
-                        source_uploaded.append((file.filename, contents))
-
-                if source_uploaded:
-                    source_file_paths = input_processor.upload_files(
-                        source_uploaded,
-                        "hybrid_source",
-                    )
-
-            # Handle source screenshots
-            if uploaded_files["source_screenshots"]:
-                source_screenshot_uploaded = []
-                for file in uploaded_files["source_screenshots"]:
-                    if file.filename:
-                        contents = await file.read()
-                        source_screenshot_uploaded.append((file.filename, contents))
-
-                if source_screenshot_uploaded:
-                    source_screenshot_paths = input_processor.upload_files(
-                        source_screenshot_uploaded,
-                        "hybrid_source_screenshots",
-                    )
-
-            # Handle target files
-            if uploaded_files["target_files"]:
-                target_uploaded = []
-                for file in uploaded_files["target_files"]:
-                    if file.filename:
-                        contents = await file.read()
-                        target_uploaded.append((file.filename, contents))
-
-                if target_uploaded:
-                    target_file_paths = input_processor.upload_files(
-                        target_uploaded,
-                        "hybrid_target",
-                    )
-
-            # Handle target screenshots
-            if uploaded_files["target_screenshots"]:
-                target_screenshot_uploaded = []
-                for file in uploaded_files["target_screenshots"]:
-                    if file.filename:
-                        contents = await file.read()
-                        target_screenshot_uploaded.append((file.filename, contents))
-
-                if target_screenshot_uploaded:
-                    target_screenshot_paths = input_processor.upload_files(
-                        target_screenshot_uploaded,
-                        "hybrid_target_screenshots",
-                    )
-
             # Create static validation request
             migration_request = input_processor.create_validation_request(
                 source_technology=hybrid_request.source_technology,
                 target_technology=hybrid_request.target_technology,
                 validation_scope=hybrid_request.validation_scope,
-                source_files=source_file_paths,
-                source_screenshots=source_screenshot_paths,
-                target_files=target_file_paths,
-                target_screenshots=target_screenshot_paths,
+                source_files=upload_paths["source_files"],
+                source_screenshots=upload_paths["source_screenshots"],
+                target_files=upload_paths["target_files"],
+                target_screenshots=upload_paths["target_screenshots"],
                 source_tech_version=hybrid_request.source_tech_version,
                 target_tech_version=hybrid_request.target_tech_version,
                 metadata=hybrid_request.metadata,
@@ -1063,9 +1325,10 @@ async def run_hybrid_validation_background(
             session.add_log(
                 f"Static validation completed with fidelity score: {static_result.fidelity_score:.2f}",
             )
+            await session_store.save(request_id, session)
+            return static_result
 
-        # Perform behavioral validation if URLs were provided
-        if perform_behavioral:
+        async def run_behavioral():
             session.add_log("Starting behavioral validation component")
 
             # Create behavioral validation request
@@ -1079,65 +1342,48 @@ async def run_hybrid_validation_background(
             )
 
             # Execute behavioral validation
-            crew = create_behavioral_validation_crew()
-            behavioral_result = await crew.validate_migration(behavioral_request)
+            async with behavioral_crews.crew() as crew:
+                behavioral_result = await crew.validate_migration(behavioral_request)
             session.add_log(
                 f"Behavioral validation completed with fidelity score: {behavioral_result.fidelity_score:.2f}",
             )
+            await session_store.save(request_id, session)
+            return behavioral_result
+
+        async def skipped():
+            return None
+
+        # The components share no state until they are combined, so run them
+        # concurrently; add_log is synchronous, so their log lines never interleave
+        components = [
+            asyncio.ensure_future(run_static() if perform_static else skipped()),
+            asyncio.ensure_future(
+                run_behavioral() if perform_behavioral else skipped()
+            ),
+        ]
+        try:
+            static_result, behavioral_result = await asyncio.gather(*components)
+        except BaseException:
+            # The hybrid result is lost once one component fails, so stop the
+            # other instead of letting it finish (e.g. a full crew run)
+            for component in components:
+                component.cancel()
+            await asyncio.gather(*components, return_exceptions=True)
+            raise
 
         # Combine results
         session.add_log("Combining static and behavioral validation results")
 
-        if static_result and behavioral_result:
-            # Hybrid result with both components
-            combined_fidelity = (
-                static_result.fidelity_score + behavioral_result.fidelity_score
-            ) / 2
-            combined_discrepancies = (
-                static_result.discrepancies + behavioral_result.discrepancies
-            )
-            combined_status = (
-                "approved"
-                if combined_fidelity >= 0.8
-                else (
-                    "approved_with_warnings" if combined_fidelity >= 0.6 else "rejected"
-                )
-            )
-
-            session.result = ValidationResult(
-                overall_status=combined_status,
-                fidelity_score=combined_fidelity,
-                summary=f"Hybrid validation completed. Static fidelity: {
-                    static_result.fidelity_score:.2f}, Behavioral fidelity: {
-                    behavioral_result.fidelity_score:.2f}, Combined: {
-                    combined_fidelity:.2f}",
-                discrepancies=combined_discrepancies,
-                execution_time=(static_result.execution_time or 0)
-                + (behavioral_result.execution_time or 0),
-            )
-
-        elif static_result:
-            # Static-only result
-            session.result = static_result
-            session.result.summary = f"Static validation completed. Fidelity score: {static_result.fidelity_score:.2f}"
-
-        elif behavioral_result:
-            # Behavioral-only result (convert from BehavioralValidationResult to
-            # ValidationResult)
-            session.result = ValidationResult(
-                overall_status=behavioral_result.overall_status,
-                fidelity_score=behavioral_result.fidelity_score,
-                summary=f"Behavioral validation completed. Fidelity score: {behavioral_result.fidelity_score:.2f}",
-                discrepancies=behavioral_result.discrepancies,
-                execution_time=behavioral_result.execution_time,
-            )
+        session.result = combine_hybrid_results(static_result, behavioral_result)
 
         session.add_log("Hybrid validation completed successfully")
+        await session_store.save(request_id, session)
 
     except Exception as e:
-        # Update session with error
-        if request_id in validation_sessions:
-            session = validation_sessions[request_id]
+        # Update session with error, keeping progress made before the failure
+        if session is None:
+            session = await session_store.get(request_id)
+        if session is not None:
             session.add_log(f"Hybrid validation failed: {e!s}")
 
             session.result = ValidationResult(
@@ -1153,6 +1399,7 @@ async def run_hybrid_validation_background(
                     ),
                 ],
             )
+            await session_store.save(request_id, session)
 
 
 # Create the FastAPI application instance
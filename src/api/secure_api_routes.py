@@ -4,7 +4,8 @@ Provides fully secured API endpoints with input validation, authentication,
 authorization, rate limiting, and audit logging.
 """
 
-from datetime import datetime
+import secrets
+from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import (
@@ -18,7 +19,7 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ..behavioral.crews import BehavioralValidationRequest as CrewBehavioralRequest
 from ..behavioral.crews import create_behavioral_validation_crew
@@ -65,7 +66,34 @@ validation_sessions: dict[str, ValidationSession] = {}
 behavioral_validation_sessions: dict[str, dict[str, Any]] = {}
 
 
+# Security headers depend only on the URL scheme (HSTS is HTTPS-only), so each
+# set is built once and reused for every response
+_security_headers = create_security_headers()
+_headers_by_scheme: dict[str, dict[str, str]] = {}
+
+
 # Helper functions
+def security_headers(request: Request) -> dict[str, str]:
+    """Return the non-empty security headers for a request's URL scheme."""
+    scheme = request.url.scheme
+    headers = _headers_by_scheme.get(scheme)
+    if headers is None:
+        headers = _headers_by_scheme[scheme] = {
+            name: value
+            for name, value in _security_headers.get_all_security_headers(
+                request
+            ).items()
+            if value
+        }
+    return headers
+
+
+def new_id(prefix: str) -> str:
+    """Time-ordered ID with a random suffix so concurrent requests never collide."""
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S%f")
+    return f"{prefix}_{timestamp}_{secrets.token_hex(4)}"
+
+
 def get_request_context(request: Request) -> dict[str, Any]:
     """Extract request context for logging."""
     return {
@@ -134,8 +162,8 @@ async def create_api_key(
         )
 
         # Add security headers
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -172,8 +200,8 @@ async def list_api_keys(
             total=len(api_keys),
         )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -206,8 +234,8 @@ async def revoke_api_key(
                 detail="API key not found",
             )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content={"message": "API key revoked successfully"},
             headers=headers,
         )
@@ -253,10 +281,14 @@ async def upload_files(
         failed_uploads = []
         total_size = 0
 
-        for file, validation_result in validation_results:
+        # One ID per upload batch; files are numbered within it
+        batch_id = new_id("file")
+
+        for index, (file, validation_result) in enumerate(validation_results):
             if validation_result.is_valid:
                 # Process successful upload
-                file_id = f"file_{datetime.utcnow().isoformat()}_{file.filename}"
+                file_id = f"{batch_id}_{index}_{file.filename}"
+                validation_details = validation_result.dict()
 
                 # Log file upload
                 await security_audit.log_file_upload(
@@ -265,7 +297,7 @@ async def upload_files(
                     filename=file.filename,
                     file_size=validation_result.file_size,
                     content_type=validation_result.detected_type,
-                    validation_result=validation_result.dict(),
+                    validation_result=validation_details,
                     source_ip=context["client_ip"],
                     request_id=context["request_id"],
                 )
@@ -279,7 +311,7 @@ async def upload_files(
                         content_type=validation_result.detected_type,
                         upload_type=upload_metadata.upload_type,
                         uploaded_at=datetime.utcnow(),
-                        validation_result=validation_result.dict(),
+                        validation_result=validation_details,
                     )
                 )
 
@@ -301,8 +333,8 @@ async def upload_files(
             total_size=total_size,
         )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -335,7 +367,7 @@ async def create_migration_validation(
         )
 
         # Create validation session
-        session_id = f"migration_{datetime.utcnow().isoformat()}"
+        session_id = new_id("migration")
         session = ValidationSession(
             session_id=session_id,
             request_id=session_id,
@@ -379,8 +411,8 @@ async def create_migration_validation(
             updated_at=session.created_at,
         )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -412,7 +444,7 @@ async def create_behavioral_validation(
         )
 
         # Create validation session
-        session_id = f"behavioral_{datetime.utcnow().isoformat()}"
+        session_id = new_id("behavioral")
         behavioral_validation_sessions[session_id] = {
             "session_id": session_id,
             "user_id": api_key_metadata.id,
@@ -451,8 +483,8 @@ async def create_behavioral_validation(
             updated_at=datetime.utcnow(),
         )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -512,8 +544,8 @@ async def get_validation_status(
                 detail="Validation request not found",
             )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -616,8 +648,8 @@ async def get_validation_result(
             request_id=context["request_id"],
         )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -657,8 +689,8 @@ async def health_check(
             uptime_seconds=uptime,
         )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
@@ -691,8 +723,8 @@ async def get_system_stats(
             timestamp=datetime.utcnow(),
         )
 
-        headers = create_security_headers()
-        return JSONResponse(
+        headers = security_headers(req)
+        return ORJSONResponse(
             content=sanitize_response_data(response_data.dict()),
             headers=headers,
         )
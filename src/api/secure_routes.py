@@ -4,11 +4,11 @@ Enhanced version of the main API routes with integrated security middleware,
 authentication, authorization, input validation, and rate limiting.
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
 from fastapi import (
     BackgroundTasks,
     Depends,
@@ -16,6 +16,7 @@ from fastapi import (
     File,
     Form,
     HTTPException,
+    Query,
     Request,
     UploadFile,
 )
@@ -25,7 +26,8 @@ from pydantic import BaseModel, Field
 from ..core.config import get_settings
 from ..core.input_processor import InputProcessor
 from ..core.migration_validator import MigrationValidator
-from ..core.models import ValidationResult, ValidationSession
+from ..core.models import ValidationSession
+from ..security.audit import security_audit
 from ..security.auth import (
     User,
     get_current_user,
@@ -36,6 +38,13 @@ from ..security.auth import (
 from ..security.middleware import SecurityMiddleware
 from ..security.rate_limiter import rate_limit
 from ..security.validation import SecurityValidationError, input_validator
+from ..services.session_store import (
+    USER_INDEX_PATTERN,
+    ValidationSessionStore,
+    user_id_from_index_key,
+    user_session_store,
+)
+from ..services.task_queue import run_stored_validation
 from .auth_routes import router as auth_router
 
 
@@ -94,8 +103,7 @@ class ValidationResultResponse(BaseModel):
     user_id: str
 
 
-# Global storage with user isolation
-validation_sessions: dict[str, ValidationSession] = {}
+# Validation sessions live in Redis under a per-user prefix (see user_session_store)
 behavioral_validation_sessions: dict[str, dict[str, Any]] = {}
 
 
@@ -135,12 +143,18 @@ def create_secure_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.on_event("shutdown")
+    async def flush_audit_log():
+        """Store audit events still queued for the batching worker."""
+        await security_audit.flush()
+
     # Include authentication routes
     app.include_router(auth_router)
 
     # Initialize components
     validator = MigrationValidator()
     input_processor = InputProcessor()
+    session_redis = ValidationSessionStore().redis
 
     # Public endpoints (no authentication required)
     @app.get("/", tags=["Health"])
@@ -357,7 +371,7 @@ def create_secure_app() -> FastAPI:
         """Execute migration validation with uploaded files (validator role required)."""
         try:
             # Parse and validate request data
-            validation_req_dict = json.loads(request_data)
+            validation_req_dict = orjson.loads(request_data)
             validated_data = await input_validator.validate_migration_request(
                 validation_req_dict
             )
@@ -433,20 +447,19 @@ def create_secure_app() -> FastAPI:
                     },
                 )
 
+            # Store initial session with user isolation
+            session_store = user_session_store(session_redis, current_user.id)
+            session = ValidationSession(request=migration_request)
+            session.add_log("Validation request received and queued for processing")
+            await session_store.save(migration_request.request_id, session)
+
             # Start validation in background with user context
             background_tasks.add_task(
-                run_secure_validation_background,
+                run_stored_validation,
                 migration_request.request_id,
                 migration_request,
                 validator,
-                current_user.id,
-            )
-
-            # Store initial session with user isolation
-            session = ValidationSession(request=migration_request)
-            session.add_log("Validation request received and queued for processing")
-            validation_sessions[f"{current_user.id}:{migration_request.request_id}"] = (
-                session
+                session_store,
             )
 
             return {
@@ -457,7 +470,7 @@ def create_secure_app() -> FastAPI:
                 "user_id": current_user.id,
             }
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid JSON in request data")
         except SecurityValidationError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -477,64 +490,28 @@ def create_secure_app() -> FastAPI:
         current_user: User = Depends(get_current_user),
     ):
         """Get validation status and progress (with user isolation)."""
-        session_key = f"{current_user.id}:{request_id}"
-
-        if session_key not in validation_sessions:
+        session_store = user_session_store(session_redis, current_user.id)
+        snapshot = await session_store.get_status(request_id)
+        if snapshot is None:
             raise HTTPException(status_code=404, detail="Validation request not found")
 
-        session = validation_sessions[session_key]
-
-        # Determine status
-        if session.result is None:
-            status = "processing"
-            progress = f"Processing step: {len(session.processing_log)}"
-        elif session.result.overall_status == "error":
-            status = "error"
-            progress = None
-        else:
-            status = "completed"
-            progress = "Validation completed"
-
         return ValidationStatusResponse(
-            request_id=request_id,
-            status=status,
-            progress=progress,
-            message=session.processing_log[-1] if session.processing_log else None,
-            result_available=session.result is not None,
-            user_id=current_user.id,
+            request_id=request_id, user_id=current_user.id, **snapshot
         )
 
     @app.get(
         "/api/validate", tags=["Validation"], dependencies=[Depends(require_viewer)]
     )
     async def list_user_validation_sessions(
+        limit: int = Query(50, ge=1, le=500),
+        offset: int = Query(0, ge=0),
         current_user: User = Depends(get_current_user),
     ):
-        """List validation sessions for current user."""
-        user_sessions = []
-
-        for session_key, session in validation_sessions.items():
-            if session_key.startswith(f"{current_user.id}:"):
-                request_id = session_key.split(":", 1)[1]
-                status = "completed" if session.result else "processing"
-                if session.result and session.result.overall_status == "error":
-                    status = "error"
-
-                user_sessions.append(
-                    {
-                        "request_id": request_id,
-                        "status": status,
-                        "created_at": session.request.created_at.isoformat(),
-                        "source_technology": session.request.source_technology.type.value,
-                        "target_technology": session.request.target_technology.type.value,
-                        "validation_scope": session.request.validation_scope.value,
-                        "fidelity_score": session.result.fidelity_score
-                        if session.result
-                        else None,
-                    },
-                )
+        """List validation sessions for current user, newest first."""
+        session_store = user_session_store(session_redis, current_user.id)
+        user_sessions, total_count = await session_store.list_summaries(offset, limit)
 
-        return {"sessions": user_sessions, "total_count": len(user_sessions)}
+        return {"sessions": user_sessions, "total_count": total_count}
 
     # Admin-only endpoints
     @app.get(
@@ -548,57 +525,16 @@ def create_secure_app() -> FastAPI:
         """List all validation sessions (admin only)."""
         all_sessions = []
 
-        for session_key, session in validation_sessions.items():
-            user_id, request_id = session_key.split(":", 1)
-            status = "completed" if session.result else "processing"
-            if session.result and session.result.overall_status == "error":
-                status = "error"
-
-            all_sessions.append(
-                {
-                    "request_id": request_id,
-                    "user_id": user_id,
-                    "status": status,
-                    "created_at": session.request.created_at.isoformat(),
-                    "source_technology": session.request.source_technology.type.value,
-                    "target_technology": session.request.target_technology.type.value,
-                    "validation_scope": session.request.validation_scope.value,
-                    "fidelity_score": session.result.fidelity_score
-                    if session.result
-                    else None,
-                },
-            )
+        async for index_key in session_redis.scan_iter(match=USER_INDEX_PATTERN):
+            user_id = user_id_from_index_key(index_key)
+            session_store = user_session_store(session_redis, user_id)
+            summaries, _ = await session_store.list_summaries(limit=None)
+            all_sessions.extend({**summary, "user_id": user_id} for summary in summaries)
 
         return {"sessions": all_sessions, "total_count": len(all_sessions)}
 
     return app
 
 
-async def run_secure_validation_background(
-    request_id: str,
-    migration_request,
-    validator: MigrationValidator,
-    user_id: str,
-):
-    """Run validation in background task with user context."""
-    session_key = f"{user_id}:{request_id}"
-
-    try:
-        session = await validator.validate_migration(migration_request)
-        validation_sessions[session_key] = session
-    except Exception as e:
-        # Update session with error
-        if session_key in validation_sessions:
-            session = validation_sessions[session_key]
-            session.add_log(f"Validation failed: {e!s}")
-
-            session.result = ValidationResult(
-                overall_status="error",
-                fidelity_score=0.0,
-                summary=f"Validation failed: {e!s}",
-                discrepancies=[],
-            )
-
-
 # Create the secure FastAPI application instance
 app = create_secure_app()
@@ -7,6 +7,8 @@ orchestrate specialized agents that test real system behavior.
 
 import asyncio
 import json
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
@@ -975,3 +977,34 @@ def create_behavioral_validation_crew(
 ) -> BehavioralValidationCrew:
     """Create behavioral validation crew with proper configuration."""
     return BehavioralValidationCrew(llm_service)
+
+
+class BehavioralCrewPool:
+    """Reuse idle behavioral crews instead of rebuilding their agents per validation.
+
+    A crew's browser tools hold per-run state, so a crew is only ever used by
+    one validation at a time; concurrent validations get separate crews.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], BehavioralValidationCrew] = create_behavioral_validation_crew,
+        max_idle: int = 8,
+    ):
+        self.factory = factory
+        self.max_idle = max_idle
+        self._idle: list[BehavioralValidationCrew] = []
+
+    @asynccontextmanager
+    async def crew(self) -> AsyncIterator[BehavioralValidationCrew]:
+        """Check out an idle crew, or build one, and return it to the pool after use."""
+        crew = self._idle.pop() if self._idle else self.factory()
+        try:
+            yield crew
+        finally:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(crew)
+
+    def clear(self) -> None:
+        """Drop idle crews so the next validations build them from current config."""
+        self._idle.clear()
@@ -0,0 +1,113 @@
+"""Recording behavioral results and combining them with static results."""
+
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Optional
+
+from ..core.models import SeverityLevel, ValidationDiscrepancy, ValidationResult
+from .crews import BehavioralValidationResult
+
+# Combined hybrid fidelity at or above these scores is approved, or approved
+# with warnings; anything lower is rejected
+HYBRID_APPROVED_THRESHOLD = 0.8
+HYBRID_WARNING_THRESHOLD = 0.6
+
+
+def serialize_discrepancies(discrepancies: list) -> list[dict[str, Any]]:
+    """Convert discrepancies to JSON-ready dicts, once when a result is stored."""
+    return [
+        {
+            "type": discrepancy.type,
+            "severity": discrepancy.severity.value,
+            "description": discrepancy.description,
+            "source_element": discrepancy.source_element,
+            "target_element": discrepancy.target_element,
+            "recommendation": discrepancy.recommendation,
+            "confidence": discrepancy.confidence,
+        }
+        for discrepancy in discrepancies
+    ]
+
+
+def record_behavioral_error(session: dict[str, Any], error: Exception) -> None:
+    """Mark a behavioral session failed, updating all its error fields at once."""
+    error_result = BehavioralValidationResult(
+        overall_status="error",
+        fidelity_score=0.0,
+        discrepancies=[
+            ValidationDiscrepancy(
+                type="behavioral_validation_error",
+                severity=SeverityLevel.CRITICAL,
+                description=f"Behavioral validation failed: {error!s}",
+                recommendation="Review system configuration and retry validation",
+            ),
+        ],
+        execution_log=[f"Error: {error!s}"],
+        execution_time=0.0,
+        timestamp=datetime.now(),
+    )
+    session["logs"].append(f"Behavioral validation error: {error!s}")
+    session.update(
+        status="error",
+        progress=f"Behavioral validation failed: {error!s}",
+        result=error_result,
+        discrepancies=serialize_discrepancies(error_result.discrepancies),
+    )
+    # Status changed, so the cached listing row is stale
+    session.pop("row", None)
+
+
+def combine_hybrid_results(
+    static_result: Optional[ValidationResult], behavioral_result
+) -> Optional[ValidationResult]:
+    """Combine the static and behavioral components of a hybrid validation.
+
+    Returns a new result and leaves the components untouched, so stored
+    components can be re-combined (e.g. under new thresholds) without
+    re-running validation. Returns None if neither component ran.
+    """
+    if static_result and behavioral_result:
+        # Hybrid result with both components
+        combined_fidelity = (
+            static_result.fidelity_score + behavioral_result.fidelity_score
+        ) / 2
+        if combined_fidelity >= HYBRID_APPROVED_THRESHOLD:
+            combined_status = "approved"
+        elif combined_fidelity >= HYBRID_WARNING_THRESHOLD:
+            combined_status = "approved_with_warnings"
+        else:
+            combined_status = "rejected"
+
+        return ValidationResult(
+            overall_status=combined_status,
+            fidelity_score=combined_fidelity,
+            summary=(
+                f"Hybrid validation completed. "
+                f"Static fidelity: {static_result.fidelity_score:.2f}, "
+                f"Behavioral fidelity: {behavioral_result.fidelity_score:.2f}, "
+                f"Combined: {combined_fidelity:.2f}"
+            ),
+            discrepancies=static_result.discrepancies + behavioral_result.discrepancies,
+            execution_time=(static_result.execution_time or 0)
+            + (behavioral_result.execution_time or 0),
+        )
+
+    if static_result:
+        # Static-only result
+        return replace(
+            static_result,
+            summary=f"Static validation completed. Fidelity score: {static_result.fidelity_score:.2f}",
+        )
+
+    if behavioral_result:
+        # Behavioral-only result (convert from BehavioralValidationResult to
+        # ValidationResult)
+        return ValidationResult(
+            overall_status=behavioral_result.overall_status,
+            fidelity_score=behavioral_result.fidelity_score,
+            summary=f"Behavioral validation completed. Fidelity score: {behavioral_result.fidelity_score:.2f}",
+            discrepancies=behavioral_result.discrepancies,
+            execution_time=behavioral_result.execution_time,
+        )
+
+    return None
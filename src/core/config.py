@@ -99,6 +99,8 @@ class SystemSettings(BaseSettings):
     redis_db: int = 0
     redis_password: Optional[str] = None
     redis_enabled: bool = True
+    session_ttl: int = 3600  # validation session expiry in seconds
+    session_sweep_interval: int = 600  # seconds between in-memory session sweeps
 
     # Celery Settings
     celery_worker_concurrency: int = 4
@@ -107,6 +109,8 @@ class SystemSettings(BaseSettings):
 
     # Performance Settings
     async_concurrency_limit: int = 10
+    max_concurrent_validations: int = 4  # in-process background validations
+    threadpool_size: int = 64  # AnyIO worker threads for sync endpoints/dependencies
     request_timeout: float = 300.0
 
     # Cache Settings
@@ -116,6 +120,17 @@ class SystemSettings(BaseSettings):
     # Logging Settings
     log_level: str = "INFO"
     log_format: str = "json"
+    log_buffer_size: int = 10000  # recent entries kept in memory for /logs/recent
+
+    # Monitoring Settings
+    metrics_cache_ttl: float = 5.0  # seconds
+    system_metrics_interval: float = 5.0  # seconds
+
+    # Audit Logging Settings
+    audit_max_queue_size: int = 10000
+    audit_batch_size: int = 128
+    audit_max_flush_interval_ms: int = 100
+    audit_enqueue_timeout_ms: int = 1000  # wait for queue space before writing inline
 
     class Config:
         env_file = ".env"
@@ -9,6 +9,7 @@ Implements the input interface described in the proposal:
 
 import os
 import tempfile
+from collections.abc import Iterable
 from typing import Any, Optional
 
 from .exceptions import resource_error
@@ -331,31 +332,10 @@ class InputProcessor(LoggerMixin):
         os.makedirs(context_dir, exist_ok=True)
 
         for filename, content in uploaded_files:
-            # Validate filename
-            if not filename or ".." in filename or "/" in filename or "\\" in filename:
-                raise ValueError(f"Invalid filename: {filename}")
-
-            # Check file size
-            if len(content) > self.max_file_size:
-                raise ValueError(f"File too large: {filename} ({len(content)} bytes)")
-
-            # Check extension
-            _, ext = os.path.splitext(filename.lower())
-            if ext not in (
-                self.allowed_code_extensions | self.allowed_image_extensions
-            ):
-                raise ValueError(f"Unsupported file type: {filename}")
+            self._validate_upload(filename, len(content))
 
             # Save file
-            file_path = os.path.join(context_dir, filename)
-
-            # Handle filename conflicts
-            counter = 1
-            original_path = file_path
-            while os.path.exists(file_path):
-                name, ext = os.path.splitext(original_path)
-                file_path = f"{name}_{counter}{ext}"
-                counter += 1
+            file_path = self._unique_upload_path(context_dir, filename)
 
             with open(file_path, "wb") as f:
                 f.write(content)
@@ -364,11 +344,115 @@ class InputProcessor(LoggerMixin):
 
         return saved_paths
 
-    def cleanup_uploads(self, file_paths: list[str]):
+    def upload_paths(
+        self,
+        spooled_files: list[tuple[str, str]],
+        context: str = "upload",
+    ) -> list[str]:
+        """Move files already spooled to disk into the upload directory.
+
+        Unlike upload_files, file contents are never held in memory. The
+        spooled files must live on the same filesystem as the upload directory
+        (e.g. be created inside it) so they can be moved without copying.
+
+        Args:
+            spooled_files: List of (filename, spooled_path) tuples
+            context: Context for organizing files
+
+        Returns:
+            List of saved file paths
+
+        Raises:
+            ValueError: If upload fails validation. All spooled files are
+                removed in that case.
+
+        """
+        return self.upload_path_groups({context: spooled_files})[context]
+
+    def upload_path_groups(
+        self,
+        groups: dict[str, list[tuple[str, str]]],
+    ) -> dict[str, list[str]]:
+        """Move several groups of spooled files into their context directories.
+
+        Every file in every group is validated before anything is moved, so a
+        rejected file never leaves part of a request's uploads in place.
+
+        Args:
+            groups: Mapping of context to (filename, spooled_path) tuples
+
+        Returns:
+            Mapping of context to saved file paths
+
+        Raises:
+            ValueError: If upload fails validation. All spooled files in all
+                groups are removed in that case.
+
+        """
+        try:
+            for spooled_files in groups.values():
+                for filename, spooled_path in spooled_files:
+                    self._validate_upload(filename, os.path.getsize(spooled_path))
+        except (ValueError, OSError):
+            self.cleanup_uploads(
+                path for spooled_files in groups.values() for _, path in spooled_files
+            )
+            raise
+
+        saved = {}
+        for context, spooled_files in groups.items():
+            saved[context] = saved_paths = []
+            if not spooled_files:
+                continue
+
+            context_dir = os.path.join(self.upload_dir, context)
+            os.makedirs(context_dir, exist_ok=True)
+            for filename, spooled_path in spooled_files:
+                file_path = self._unique_upload_path(context_dir, filename)
+                os.replace(spooled_path, file_path)
+                saved_paths.append(file_path)
+
+        return saved
+
+    def _validate_upload(self, filename: str, size: int):
+        """Validate an uploaded file's name, size and extension.
+
+        Raises:
+            ValueError: If the upload is not acceptable
+
+        """
+        # Validate filename
+        if not filename or ".." in filename or "/" in filename or "\\" in filename:
+            raise ValueError(f"Invalid filename: {filename}")
+
+        # Check file size
+        if size > self.max_file_size:
+            raise ValueError(f"File too large: {filename} ({size} bytes)")
+
+        # Check extension
+        _, ext = os.path.splitext(filename.lower())
+        if ext not in (self.allowed_code_extensions | self.allowed_image_extensions):
+            raise ValueError(f"Unsupported file type: {filename}")
+
+    def _unique_upload_path(self, context_dir: str, filename: str) -> str:
+        """Return a path for filename in context_dir that does not exist yet."""
+        file_path = os.path.join(context_dir, filename)
+
+        # Handle filename conflicts
+        counter = 1
+        original_path = file_path
+        while os.path.exists(file_path):
+            name, ext = os.path.splitext(original_path)
+            file_path = f"{name}_{counter}{ext}"
+            counter += 1
+
+        return file_path
+
+    def cleanup_uploads(self, file_paths: Iterable[str]):
         """Clean up uploaded files.
 
         Args:
-            file_paths: List of file paths to clean up
+            file_paths: File paths to clean up; any iterable is consumed once
 
         """
         for file_path in file_paths:
@@ -47,11 +47,12 @@ class MigrationValidator(LoggerMixin):
     and retry mechanisms for enhanced reliability.
     """
 
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, http_client=None):
         """Initialize migration validator.
 
         Args:
             llm_client: Optional LLM service instance for enhanced analysis
+            http_client: Optional shared httpx.AsyncClient for the LLM service
 
         Raises:
             ConfigurationError: If critical configuration is invalid
@@ -73,6 +74,7 @@ class MigrationValidator(LoggerMixin):
                         max_tokens=llm_config.max_tokens,
                         temperature=llm_config.temperature,
                         timeout=llm_config.timeout,
+                        http_client=http_client,
                     )
                     self.logger.info(
                         "LLM service initialized",
@@ -388,7 +390,8 @@ class MigrationValidator(LoggerMixin):
             format: Report format ('json', 'html', 'markdown')
 
         Returns:
-            Generated report as string
+            Generated report as string; for 'json' this is the already
+            JSON-encoded document, suitable for returning to clients as-is
 
         """
         if not session.result:
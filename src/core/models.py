@@ -4,10 +4,10 @@ Defines the fundamental data structures for representing migration contexts,
 validation results, and system operations.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Union, get_args, get_origin, get_type_hints
 
 
 class TechnologyType(Enum):
@@ -180,6 +180,15 @@ class MigrationValidationRequest:
     request_id: str = field(default_factory=lambda: f"req_{datetime.now().isoformat()}")
     created_at: datetime = field(default_factory=datetime.now)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the request to JSON-serializable primitives."""
+        return _to_primitive(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MigrationValidationRequest":
+        """Rebuild a request produced by to_dict()."""
+        return _from_primitive(cls, data)
+
 
 @dataclass
 class ValidationSession:
@@ -195,3 +204,67 @@ class ValidationSession:
         """Add a log entry with timestamp."""
         timestamp = datetime.now().isoformat()
         self.processing_log.append(f"[{timestamp}] {message}")
+
+    @property
+    def latest_log(self) -> Optional[str]:
+        """Most recent log entry, if any."""
+        return self.processing_log[-1] if self.processing_log else None
+
+    @property
+    def log_count(self) -> int:
+        """Number of log entries recorded so far."""
+        return len(self.processing_log)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the session to JSON-serializable primitives."""
+        return _to_primitive(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ValidationSession":
+        """Rebuild a session produced by to_dict()."""
+        return _from_primitive(cls, data)
+
+
+def _to_primitive(value: Any) -> Any:
+    """Recursively convert dataclasses, enums and datetimes to JSON primitives."""
+    if is_dataclass(value):
+        return {f.name: _to_primitive(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_to_primitive(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_primitive(item) for key, item in value.items()}
+    return value
+
+
+def _from_primitive(tp: Any, value: Any) -> Any:
+    """Inverse of _to_primitive, driven by the dataclass type hints."""
+    if value is None:
+        return None
+
+    origin = get_origin(tp)
+    if origin is Union:
+        # Optional[X]: value is not None, so decode as X
+        inner = [arg for arg in get_args(tp) if arg is not type(None)]
+        return _from_primitive(inner[0], value) if len(inner) == 1 else value
+    if origin is list:
+        (item_type,) = get_args(tp) or (Any,)
+        return [_from_primitive(item_type, item) for item in value]
+    if isinstance(tp, type):
+        if is_dataclass(tp):
+            hints = get_type_hints(tp)
+            return tp(
+                **{
+                    f.name: _from_primitive(hints[f.name], value[f.name])
+                    for f in fields(tp)
+                    if f.name in value
+                }
+            )
+        if issubclass(tp, Enum):
+            return tp(value)
+        if tp is datetime:
+            return datetime.fromisoformat(value)
+    return value
@@ -176,26 +176,29 @@ class SecurityDatabaseService:
             return []
 
     # Audit Logging
+    @staticmethod
+    def _build_audit_log(event_data: dict[str, Any]) -> AuditLogModel:
+        """Build an audit log model from event data."""
+        return AuditLogModel(
+            id=event_data["event_id"],
+            event_type=event_data["event_type"],
+            severity=event_data["severity"],
+            user_id=event_data.get("user_id"),
+            api_key_id=event_data.get("api_key_id"),
+            source_ip=event_data.get("source_ip"),
+            user_agent=event_data.get("user_agent"),
+            resource=event_data.get("resource"),
+            action=event_data["action"],
+            result=event_data["result"],
+            details=event_data.get("details"),
+            request_id=event_data.get("request_id"),
+            session_id=event_data.get("session_id"),
+        )
+
     async def store_audit_event(self, event_data: dict[str, Any]) -> bool:
         """Store audit event."""
         try:
-            audit_log = AuditLogModel(
-                id=event_data["event_id"],
-                event_type=event_data["event_type"],
-                severity=event_data["severity"],
-                user_id=event_data.get("user_id"),
-                api_key_id=event_data.get("api_key_id"),
-                source_ip=event_data.get("source_ip"),
-                user_agent=event_data.get("user_agent"),
-                resource=event_data.get("resource"),
-                action=event_data["action"],
-                result=event_data["result"],
-                details=event_data.get("details"),
-                request_id=event_data.get("request_id"),
-                session_id=event_data.get("session_id"),
-            )
-
-            self.session.add(audit_log)
+            self.session.add(self._build_audit_log(event_data))
             await self.session.commit()
             return True
 
@@ -204,6 +207,20 @@ class SecurityDatabaseService:
             logger.error(f"Failed to store audit event: {e}")
             return False
 
+    async def store_audit_events_bulk(self, events_data: list[dict[str, Any]]) -> bool:
+        """Store a batch of audit events in a single transaction."""
+        try:
+            self.session.add_all(
+                [self._build_audit_log(event_data) for event_data in events_data]
+            )
+            await self.session.commit()
+            return True
+
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Failed to store {len(events_data)} audit events: {e}")
+            return False
+
     async def query_audit_events(
         self,
         start_date: datetime,
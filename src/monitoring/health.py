@@ -6,7 +6,7 @@ import asyncio
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Optional
 
 import redis
 from src.core.config import get_validation_config
@@ -90,6 +90,7 @@ class SystemHealthMonitor:
     def __init__(self):
         self.config = get_validation_config()
         self.health_checks: dict[str, HealthCheck] = {}
+        self._cached_health: Optional[tuple[float, dict[str, Any]]] = None
         self._register_default_checks()
 
     def _register_default_checks(self):
@@ -222,6 +223,21 @@ class SystemHealthMonitor:
 
         return health_report
 
+    async def cached_check_health(self, ttl: float = 5.0) -> dict[str, Any]:
+        """Return a summary health report, re-running checks at most every ``ttl`` seconds."""
+        if self._cached_health is not None:
+            checked_at, health_report = self._cached_health
+            if time.monotonic() - checked_at < ttl:
+                return health_report
+
+        health_report = await self.check_health(include_details=False)
+        self._cached_health = (time.monotonic(), health_report)
+        return health_report
+
+    def invalidate_health_cache(self):
+        """Discard the cached summary report so the next request re-runs checks."""
+        self._cached_health = None
+
     async def _check_redis_connectivity(self) -> dict[str, Any]:
         """Check Redis connectivity."""
         try:
@@ -5,8 +5,11 @@ JSON-formatted logging with comprehensive context tracking.
 import logging
 import sys
 import uuid
+from collections import deque
+from collections.abc import Iterable
 from contextlib import contextmanager
-from typing import Optional
+from itertools import islice
+from typing import Any, Optional
 
 import structlog
 from src.core.config import get_validation_config
@@ -18,35 +21,48 @@ class StructuredLogger:
     def __init__(self, name: str = "migration_validator"):
         self.config = get_validation_config()
         self.logger_name = name
+        self._ring: deque[dict[str, Any]] = deque(
+            maxlen=self.config.settings.log_buffer_size
+        )
         self._configure_structlog()
 
     def _configure_structlog(self):
         """Configure structlog for JSON output."""
+        self.level = getattr(logging, self.config.settings.log_level.upper())
+
         # Configure stdlib logging
         logging.basicConfig(
             format="%(message)s",
             stream=sys.stdout,
-            level=getattr(logging, self.config.settings.log_level.upper()),
+            level=self.level,
         )
 
+        processors = [
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            self._add_service_context,
+            self._add_request_id,
+            structlog.processors.JSONRenderer(),
+        ]
+        wrapper_class = structlog.make_filtering_bound_logger(self.level)
+
         # Configure structlog
         structlog.configure(
-            processors=[
-                structlog.contextvars.merge_contextvars,
-                structlog.processors.add_log_level,
-                structlog.processors.TimeStamper(fmt="iso"),
-                self._add_service_context,
-                self._add_request_id,
-                structlog.processors.JSONRenderer(),
-            ],
-            wrapper_class=structlog.make_filtering_bound_logger(
-                getattr(logging, self.config.settings.log_level.upper()),
-            ),
+            processors=processors,
+            wrapper_class=wrapper_class,
             logger_factory=structlog.WriteLoggerFactory(),
             cache_logger_on_first_use=True,
         )
 
-        self.logger = structlog.get_logger(self.logger_name)
+        # Bound explicitly so later structlog.configure() calls elsewhere do not
+        # replace this logger's processors (and its recent-entries buffer)
+        self.logger = structlog.wrap_logger(
+            structlog.WriteLoggerFactory()(),
+            processors=[*processors[:-1], self._record_recent, processors[-1]],
+            wrapper_class=wrapper_class,
+            logger_name=self.logger_name,
+        )
 
     def _add_service_context(self, _, __, event_dict):
         """Add service-level context to all log entries."""
@@ -67,6 +83,41 @@ class StructuredLogger:
             event_dict["request_id"] = request_id
         return event_dict
 
+    def _record_recent(self, _, __, event_dict):
+        """Keep a copy of each entry in the bounded recent-entries buffer."""
+        self._ring.append(dict(event_dict))
+        return event_dict
+
+    def recent_entries(
+        self,
+        limit: int,
+        level: Optional[str] = None,
+        component: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Return up to ``limit`` most recent entries, newest first."""
+        try:
+            return self._filter_recent(reversed(self._ring), limit, level, component)
+        except RuntimeError:
+            # Appended to from another thread mid-iteration; retry on a snapshot
+            return self._filter_recent(
+                reversed(tuple(self._ring)), limit, level, component
+            )
+
+    @staticmethod
+    def _filter_recent(
+        entries: Iterable[dict[str, Any]],
+        limit: int,
+        level: Optional[str],
+        component: Optional[str],
+    ) -> list[dict[str, Any]]:
+        """Apply level/component filters lazily and take the first ``limit`` matches."""
+        if level is not None:
+            level = level.lower()
+            entries = (e for e in entries if e.get("level") == level)
+        if component is not None:
+            entries = (e for e in entries if e.get("component") == component)
+        return list(islice(entries, limit))
+
     def _get_hostname(self) -> str:
         """Get system hostname."""
         import socket
@@ -104,6 +155,10 @@ class StructuredLogger:
             if token:
                 contextvars.request_id.reset(token)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check if a stdlib logging level would be emitted (mirrors logging.Logger)."""
+        return level >= self.level
+
     def info(self, message: str, **kwargs):
         """Log info level message."""
         self.logger.info(message, **kwargs)
@@ -195,6 +250,9 @@ class StructuredLogger:
 
     def log_error(self, error: Exception, component: str, operation: str, **kwargs):
         """Log error with comprehensive context."""
+        if not self.isEnabledFor(logging.ERROR):
+            return
+
         self.error(
             "Error occurred",
             event_type="error",
@@ -23,6 +23,7 @@ class MetricsCollector:
 
     def __init__(self, registry: Optional[CollectorRegistry] = None):
         self.registry = registry or CollectorRegistry()
+        self._gauge_handles: dict[str, Gauge] = {}
         self._initialize_metrics()
 
     def _initialize_metrics(self):
@@ -422,8 +423,8 @@ class MetricsCollector:
             memory = psutil.virtual_memory()
             self.memory_usage.set(memory.used)
 
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous call; callers sample at a fixed cadence
+            cpu_percent = psutil.cpu_percent(interval=None)
             self.cpu_usage.set(cpu_percent)
 
         except ImportError:
@@ -431,18 +432,57 @@ class MetricsCollector:
 
     def update_queue_metrics(self, queue_stats: dict[str, Any]):
         """Update Celery queue metrics."""
-        for queue_name, size in queue_stats.get("queue_sizes", {}).items():
-            self.task_queue_size.labels(queue_name=queue_name).set(size)
-
-        for worker_name, active_count in queue_stats.get("worker_tasks", {}).items():
-            self.worker_active_tasks.labels(worker_name=worker_name).set(active_count)
+        self.update_from_mapping(self.queue_metrics_mapping(queue_stats))
 
     def update_cache_metrics(self, cache_stats: dict[str, Any]):
         """Update cache metrics."""
-        self.cache_size.set(cache_stats.get("memory_used_bytes", 0))
+        self.update_from_mapping(self.cache_metrics_mapping(cache_stats))
 
-    def generate_metrics(self) -> str:
-        """Generate Prometheus metrics output."""
+    def queue_metrics_mapping(self, queue_stats: dict[str, Any]) -> dict[str, float]:
+        """Map Celery queue stats to gauge keys for update_from_mapping."""
+        mapping = {
+            f"task_queue_size:{queue_name}": size
+            for queue_name, size in queue_stats.get("queue_sizes", {}).items()
+        }
+        mapping.update(
+            {
+                f"worker_active_tasks:{worker_name}": active_count
+                for worker_name, active_count in queue_stats.get(
+                    "worker_tasks", {}
+                ).items()
+            }
+        )
+        return mapping
+
+    def cache_metrics_mapping(self, cache_stats: dict[str, Any]) -> dict[str, float]:
+        """Map cache stats to gauge keys for update_from_mapping."""
+        return {"cache_size": cache_stats.get("memory_used_bytes", 0)}
+
+    def update_from_mapping(self, mapping: dict[str, float]):
+        """Set many gauges in one call.
+
+        Keys are gauge attribute names, with ``:<label value>`` appended for
+        single-label gauges (e.g. ``task_queue_size:default``). Resolved gauge
+        and labelled child handles are cached so repeated updates skip
+        attribute and label lookups.
+        """
+        handles = self._gauge_handles
+        for key, value in mapping.items():
+            handle = handles.get(key)
+            if handle is None:
+                name, _, label_value = key.partition(":")
+                handle = getattr(self, name)
+                if label_value:
+                    handle = handle.labels(label_value)
+                handles[key] = handle
+            handle.set(value)
+
+    def generate_metrics(self) -> bytes:
+        """Generate Prometheus metrics output as UTF-8 encoded exposition text.
+
+        generate_latest() collects lines in a list and joins them once, so the
+        output is allocated at its final size and needs no size hint.
+        """
         return generate_latest(self.registry)
 
     def _estimate_llm_cost(self, provider: str, model: str, result: Any) -> float:
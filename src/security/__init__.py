@@ -19,6 +19,7 @@ from .audit import AuditEventType, AuditSeverity, SecurityAuditLogger, security_
 from .auth import (
     create_access_token,
     decode_access_token,
+    decode_access_token_cached,
     get_password_hash,
     verify_password,
 )
@@ -76,6 +77,7 @@ __all__ = [
     # Authentication & Authorization
     "create_access_token",
     "decode_access_token",
+    "decode_access_token_cached",
     "get_password_hash",
     "verify_password",
     # Encryption
@@ -4,8 +4,11 @@ Provides secure API key authentication for service-to-service communication
 with proper scope-based authorization and audit logging.
 """
 
+import asyncio
 import hashlib
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict
 from typing import List
@@ -24,6 +27,13 @@ from .schemas import APIKeyCreateRequest
 from .schemas import APIKeyResponse
 from .schemas import APIKeyScope
 
+# Successful API key validations are reused for up to API_KEY_CACHE_TTL
+# seconds, keyed by a SHA-256 of the raw key. A revoke clears this worker's
+# entries at once; other workers may accept a revoked key until theirs expire.
+API_KEY_CACHE_SIZE = 4096
+API_KEY_CACHE_TTL = 30.0
+_api_key_cache: "OrderedDict[str, tuple[APIKeyMetadata, float]]" = OrderedDict()
+
 
 class APIKeyMetadata(BaseModel):
     """API key metadata model."""
@@ -111,7 +121,12 @@ class APIKeyManager:
             )
 
     async def validate_api_key(self, api_key: str) -> APIKeyMetadata:
-        """Validate API key and return metadata."""
+        """Validate API key and return metadata.
+
+        Recent successful validations are served from an in-process cache,
+        skipping the PBKDF2 hash, the database lookup and the last-used
+        update; expiry is still checked on every call.
+        """
         try:
             if not api_key or not api_key.startswith("amvs_"):
                 raise HTTPException(
@@ -119,8 +134,20 @@ class APIKeyManager:
                     detail="Invalid API key format",
                 )
 
-            # Hash the provided key
-            hashed_key = self._hash_api_key(api_key)
+            cache_key = hashlib.sha256(api_key.encode()).hexdigest()
+            now = time.monotonic()
+            entry = _api_key_cache.get(cache_key)
+            if entry is not None:
+                metadata, valid_until = entry
+                if now < valid_until and not (
+                    metadata.expires_at and datetime.utcnow() > metadata.expires_at
+                ):
+                    _api_key_cache.move_to_end(cache_key)
+                    return metadata
+                del _api_key_cache[cache_key]
+
+            # Hash the provided key; PBKDF2 is slow, so keep it off the event loop
+            hashed_key = await asyncio.to_thread(self._hash_api_key, api_key)
 
             # Retrieve from database
             stored_data = await self.db.get_api_key_by_hash(hashed_key)
@@ -152,6 +179,10 @@ class APIKeyManager:
             # Update last used timestamp
             await self._update_last_used(metadata.id)
 
+            _api_key_cache[cache_key] = (metadata, now + API_KEY_CACHE_TTL)
+            if len(_api_key_cache) > API_KEY_CACHE_SIZE:
+                _api_key_cache.popitem(last=False)
+
             return metadata
 
         except HTTPException:
@@ -175,6 +206,7 @@ class APIKeyManager:
         try:
             success = await self.db.deactivate_api_key(api_key_id)
             if success:
+                invalidate_cached_api_key(api_key_id)
                 self.logger.info(
                     "API key revoked",
                     api_key_id=api_key_id,
@@ -228,6 +260,17 @@ class APIKeyManager:
         )
 
 
+def invalidate_cached_api_key(api_key_id: str) -> None:
+    """Drop cached validations of an API key, e.g. after it is revoked."""
+    stale = [
+        cache_key
+        for cache_key, (metadata, _) in _api_key_cache.items()
+        if metadata.id == api_key_id
+    ]
+    for cache_key in stale:
+        del _api_key_cache[cache_key]
+
+
 # Global API key manager instance
 # Global instance - will be initialized with session when needed
 api_key_manager = None
@@ -4,6 +4,7 @@ Provides detailed audit trails for all security-related events including
 authentication, authorization, data access, and security violations.
 """
 
+import asyncio
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
@@ -12,7 +13,9 @@ from pydantic import BaseModel
 
 from ..core.config import get_settings
 from ..core.logging import logger
+from ..database.security_service import SecurityDatabaseService
 from ..database.service import get_database_service
+from ..database.session import get_database_manager
 
 
 class AuditEventType(str, Enum):
@@ -89,11 +92,19 @@ class AuditEvent(BaseModel):
 class SecurityAuditLogger:
     """Comprehensive security audit logging system."""
 
-    def __init__(self, session=None):
+    def __init__(self, session=None, session_factory=None):
         self.settings = get_settings()
         self.db = get_database_service(session) if session else None
         self.logger = logger.bind(component="SecurityAudit")
 
+        # Audit batches are written on sessions of their own, never on the
+        # request-scoped session above; defaults to the app database manager
+        self._session_factory = session_factory
+
+        # Events are buffered and written in batches by a background worker
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_worker_task: Optional[asyncio.Task] = None
+
     async def log_event(
         self,
         event_type: AuditEventType,
@@ -130,8 +141,8 @@ class SecurityAuditLogger:
         )
 
         try:
-            # Store in database
-            await self.db.store_audit_event(event.dict())
+            # Queue for batched storage in database
+            await self._enqueue_event(event.dict())
 
             # Log to application logger
             self.logger.info(
@@ -153,6 +164,130 @@ class SecurityAuditLogger:
         except Exception as e:
             self.logger.error("Failed to log audit event", error=str(e))
 
+    async def log_events_bulk(self, events: list[dict[str, Any]]):
+        """Store a batch of audit events in a single database round trip."""
+        session_factory = self._session_factory or get_database_manager().get_session
+        try:
+            async with session_factory() as session:
+                await SecurityDatabaseService(session).store_audit_events_bulk(events)
+        except Exception as e:
+            self.logger.error(
+                "Failed to store audit event batch", error=str(e), count=len(events)
+            )
+
+    async def flush(self):
+        """Store every queued event, then stop the background worker.
+
+        Call on shutdown; events written after this start a new worker.
+        """
+        queue, task = self._audit_queue, self._audit_worker_task
+        self._audit_queue = None
+        self._audit_worker_task = None
+
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            # Let the worker finish the batch it is holding before stopping it
+            await queue.join()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        if queue is not None:
+            pending = self._drain_queue(queue)
+            if pending:
+                await self.log_events_bulk(pending)
+
+    @staticmethod
+    def _drain_queue(queue: asyncio.Queue) -> list[dict[str, Any]]:
+        """Take every event still waiting in a queue."""
+        pending = []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+            queue.task_done()
+        return pending
+
+    def _ensure_audit_worker(self):
+        """Start the batching worker on the running event loop if needed.
+
+        Events left in a replaced queue are carried over to the new one.
+        """
+        task = self._audit_worker_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            pending = (
+                self._drain_queue(self._audit_queue)
+                if self._audit_queue is not None
+                else []
+            )
+            self._audit_queue = asyncio.Queue(
+                maxsize=max(self.settings.audit_max_queue_size, len(pending))
+            )
+            for event_data in pending:
+                self._audit_queue.put_nowait(event_data)
+            self._audit_worker_task = asyncio.create_task(
+                self._audit_worker(self._audit_queue)
+            )
+
+    async def _enqueue_event(self, event_data: dict[str, Any]):
+        """Hand an event to the batching worker, waiting briefly when it is full.
+
+        If the worker cannot make room in time the event is stored on its own
+        session rather than dropped.
+        """
+        self._ensure_audit_worker()
+        try:
+            self._audit_queue.put_nowait(event_data)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(
+                    self._audit_queue.put(event_data),
+                    self.settings.audit_enqueue_timeout_ms / 1000,
+                )
+            except asyncio.TimeoutError:
+                await self.log_events_bulk([event_data])
+
+    async def _audit_worker(self, queue: asyncio.Queue):
+        """Flush queued events every batch_size events or flush interval."""
+        loop = asyncio.get_running_loop()
+        batch_size = self.settings.audit_batch_size
+        flush_interval = self.settings.audit_max_flush_interval_ms / 1000
+        batch = []
+
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + flush_interval
+
+                while len(batch) < batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self.log_events_bulk(batch)
+                for _ in batch:
+                    queue.task_done()
+                batch = []
+        except asyncio.CancelledError:
+            # Events taken off the queue are stored even if cancelled mid-write;
+            # a duplicate audit row is preferable to a missing one
+            if batch:
+                await self.log_events_bulk(batch)
+                for _ in batch:
+                    queue.task_done()
+            raise
+
     async def _alert_critical_event(self, event: AuditEvent):
         """Alert on critical security events."""
         # In production, this would trigger alerts via email, Slack, etc.
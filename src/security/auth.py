@@ -1,3 +1,6 @@
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -13,6 +16,12 @@ ALGORITHM = security_settings.ALGORITHM
 SECRET_KEY = security_settings.SECRET_KEY
 ACCESS_TOKEN_EXPIRE_MINUTES = security_settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+# Successfully decoded tokens, keyed by SHA-256 of the token, with the time
+# each entry stops being valid; least recently used entries are evicted first
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL = 30.0
+_token_cache: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
@@ -44,3 +53,32 @@ def decode_access_token(token: str):
     except JWTError as e:
         logger.warning("Could not validate credentials", error=str(e))
         return None
+
+
+def decode_access_token_cached(token: str) -> Optional[dict]:
+    """Decode a JWT access token, reusing recent successful decodes.
+
+    Entries are kept for at most TOKEN_CACHE_TTL seconds and never past the
+    token's ``exp`` claim. Invalid tokens are not cached.
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    now = time.time()
+
+    entry = _token_cache.get(key)
+    if entry is not None:
+        payload, valid_until = entry
+        if now < valid_until:
+            _token_cache.move_to_end(key)
+            return payload
+        del _token_cache[key]
+
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+
+    valid_until = min(now + TOKEN_CACHE_TTL, payload.get("exp", now))
+    if valid_until > now:
+        _token_cache[key] = (payload, valid_until)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return payload
@@ -259,11 +259,10 @@ class SecurityValidator:
                 f"Declared type {declared_type} differs from detected type {detected_type}",
             )
 
-        # Scan for suspicious content patterns
-        content_str = content.decode("utf-8", errors="ignore")
-
-        # Check for embedded scripts in text files
+        # Check for embedded scripts in text files; only these are decoded,
+        # so binary uploads are not copied into a throwaway string
         if detected_type.startswith("text/"):
+            content_str = content.decode("utf-8", errors="ignore")
             for pattern in self.xss_patterns:
                 if pattern.search(content_str):
                     issues.append("File contains potential XSS content")
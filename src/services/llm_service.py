@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
+import httpx
 import structlog
 
 from .prompt_templates import AnalysisType, prompt_manager
@@ -94,11 +95,20 @@ class LLMService:
     and natural language processing tasks in the migration validation pipeline.
     """
 
-    def __init__(self, configs: list[LLMConfig]):
-        """Initialize LLM service with a list of configurations for failover."""
+    def __init__(
+        self,
+        configs: list[LLMConfig],
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize LLM service with a list of configurations for failover.
+
+        ``http_client`` is shared by the OpenAI and Anthropic clients so they
+        reuse one connection pool; each SDK creates its own when omitted.
+        """
         if not configs:
             raise LLMServiceError("At least one LLM configuration is required.")
         self.configs = configs
+        self.http_client = http_client
         self.logger = logger.bind(
             providers=[c.provider.value for c in configs],
             models=[c.model for c in configs],
@@ -124,6 +134,7 @@ class LLMService:
                     self._clients[config.provider] = AsyncOpenAI(
                         api_key=api_key,
                         timeout=config.timeout,
+                        http_client=self.http_client,
                     )
 
                 elif config.provider == LLMProvider.ANTHROPIC:
@@ -135,6 +146,7 @@ class LLMService:
                     self._clients[config.provider] = AsyncAnthropic(
                         api_key=api_key,
                         timeout=config.timeout,
+                        http_client=self.http_client,
                     )
 
                 elif config.provider == LLMProvider.GOOGLE:
@@ -845,6 +857,7 @@ Provide comprehensive UI comparison analysis.""",
 def create_llm_service(
     providers: str = "openai",
     models: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
     **kwargs,
 ) -> LLMService:
     """Factory function to create LLM service with failover support.
@@ -852,6 +865,7 @@ def create_llm_service(
     Args:
         providers: Comma-separated string of LLM provider names (e.g., "openai,anthropic").
         models: Comma-separated string of model names. If provided, must match the number of providers.
+        http_client: Optional shared HTTP client for provider SDKs.
         **kwargs: Additional configuration options applied to all providers.
 
     Returns:
@@ -883,4 +897,4 @@ def create_llm_service(
 
         configs.append(LLMConfig(provider=provider_enum, model=model, **kwargs))
 
-    return LLMService(configs)
+    return LLMService(configs, http_client=http_client)
@@ -0,0 +1,264 @@
+"""Redis-backed storage for validation sessions.
+
+Sessions are shared by every API worker and expire after a TTL, so status
+polling works across ``uvicorn --workers N`` and memory stays bounded.
+"""
+
+import gzip
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+import orjson
+import redis.asyncio as aioredis
+from src.core.config import get_validation_config
+from src.core.models import ValidationSession
+
+# Report formats rendered by MigrationValidator.generate_report
+REPORT_FORMATS = ("json", "html", "markdown")
+
+# Cached reports are read back from Redis in chunks of this size
+REPORT_CHUNK_SIZE = 64 * 1024
+
+# Per-user stores (see user_session_store) share this prefix; the listing index
+# of each matches USER_INDEX_PATTERN
+USER_STORE_PREFIX = "secure"
+USER_INDEX_PATTERN = f"{USER_STORE_PREFIX}:*:index"
+
+
+class ValidationSessionStore:
+    """Store validation sessions in Redis with a compact status key per session."""
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        ttl: Optional[int] = None,
+        prefix: str = "session",
+    ):
+        config = get_validation_config()
+        self.redis = redis_client or aioredis.Redis(
+            host=config.redis_host,
+            port=config.redis_port,
+            db=config.redis_db,
+            password=config.settings.redis_password,
+        )
+        self.ttl = ttl if ttl is not None else config.settings.session_ttl
+        self.prefix = prefix
+        # Sorted set of request IDs scored by last save time, for listing
+        self.index_key = f"{prefix}:index"
+
+    def _expired_before(self) -> str:
+        """Exclusive index score bound below which sessions have outlived the TTL."""
+        return f"({time.time() - self.ttl}"
+
+    def _key(self, request_id: str) -> str:
+        return f"{self.prefix}:{request_id}"
+
+    def _status_key(self, request_id: str) -> str:
+        return f"{self.prefix}:{request_id}:status"
+
+    def _result_key(self, request_id: str) -> str:
+        return f"{self.prefix}:{request_id}:result"
+
+    def _summary_key(self, request_id: str) -> str:
+        return f"{self.prefix}:summary:{request_id}"
+
+    def _report_key(self, request_id: str, format: str) -> str:
+        return f"{self.prefix}:report:{request_id}:{format}"
+
+    @staticmethod
+    def status_snapshot(session: ValidationSession) -> dict[str, Any]:
+        """Summarize a session for status polling without its full result."""
+        if session.result is None:
+            status = "processing"
+            progress = f"Processing step: {session.log_count}"
+        elif session.result.overall_status == "error":
+            status = "error"
+            progress = None
+        else:
+            status = "completed"
+            progress = "Validation completed"
+
+        return {
+            "status": status,
+            "progress": progress,
+            "message": session.latest_log,
+            "result_available": session.result is not None,
+        }
+
+    @staticmethod
+    def result_snapshot(session: ValidationSession) -> dict[str, Any]:
+        """Summarize a finished session's result with discrepancies counted by severity."""
+        result = session.result
+        counts = Counter(d.severity.value for d in result.discrepancies)
+        return {
+            "overall_status": result.overall_status,
+            "fidelity_score": result.fidelity_score,
+            "summary": result.summary,
+            "discrepancy_counts": {
+                "critical": counts["critical"],
+                "warning": counts["warning"],
+                "info": counts["info"],
+            },
+            "execution_time": result.execution_time,
+            "timestamp": result.timestamp.isoformat(),
+        }
+
+    @classmethod
+    def summary(cls, request_id: str, session: ValidationSession) -> dict[str, Any]:
+        """Summarize a session for session listings."""
+        request = session.request
+        return {
+            "request_id": request_id,
+            "status": cls.status_snapshot(session)["status"],
+            "created_at": request.created_at.isoformat() if request else None,
+            "source_technology": (
+                request.source_technology.type.value if request else None
+            ),
+            "target_technology": (
+                request.target_technology.type.value if request else None
+            ),
+            "validation_scope": request.validation_scope.value if request else None,
+            "fidelity_score": session.result.fidelity_score if session.result else None,
+        }
+
+    async def save(self, request_id: str, session: ValidationSession) -> None:
+        """Store a session, its status snapshot and listing summary, refreshing the TTL."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(request_id), orjson.dumps(session.to_dict()), ex=self.ttl)
+            pipe.set(
+                self._status_key(request_id),
+                orjson.dumps(self.status_snapshot(session)),
+                ex=self.ttl,
+            )
+            pipe.set(
+                self._summary_key(request_id),
+                orjson.dumps(self.summary(request_id, session)),
+                ex=self.ttl,
+            )
+            if session.result is not None:
+                pipe.set(
+                    self._result_key(request_id),
+                    orjson.dumps(self.result_snapshot(session)),
+                    ex=self.ttl,
+                )
+            # Scored by save time, like the TTL refreshed above, so the index
+            # entry expires together with the session keys
+            pipe.zadd(self.index_key, {request_id: time.time()})
+            pipe.zremrangebyscore(self.index_key, "-inf", self._expired_before())
+            await pipe.execute()
+
+    async def get(self, request_id: str) -> Optional[ValidationSession]:
+        """Load a session, or None if it does not exist or has expired."""
+        data = await self.redis.get(self._key(request_id))
+        if data is None:
+            return None
+        return ValidationSession.from_dict(orjson.loads(data))
+
+    async def get_status(self, request_id: str) -> Optional[dict[str, Any]]:
+        """Load only the status snapshot of a session."""
+        data = await self.redis.get(self._status_key(request_id))
+        return orjson.loads(data) if data is not None else None
+
+    async def get_result(self, request_id: str) -> Optional[dict[str, Any]]:
+        """Load the result snapshot, or None until the session has a result."""
+        data = await self.redis.get(self._result_key(request_id))
+        return orjson.loads(data) if data is not None else None
+
+    async def report_size(self, request_id: str, format: str) -> int:
+        """Size of a cached gzipped report in bytes, or 0 if it is not cached."""
+        return await self.redis.strlen(self._report_key(request_id, format))
+
+    async def iter_report(
+        self, request_id: str, format: str, chunk_size: int = REPORT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Yield a cached gzipped report chunk by chunk using GETRANGE."""
+        key = self._report_key(request_id, format)
+        offset = 0
+        while True:
+            chunk = await self.redis.getrange(key, offset, offset + chunk_size - 1)
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                break
+            offset += chunk_size
+
+    async def save_report(self, request_id: str, format: str, content: str) -> bytes:
+        """Gzip and store a rendered report for the lifetime of its session.
+
+        Returns the compressed bytes so callers can serve them directly.
+        """
+        compressed = gzip.compress(content.encode())
+        await self.redis.set(
+            self._report_key(request_id, format), compressed, ex=self.ttl
+        )
+        return compressed
+
+    async def delete(self, request_id: str) -> bool:
+        """Delete a session and its rendered reports. Returns False if it did not exist."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(
+                self._key(request_id),
+                self._status_key(request_id),
+                self._result_key(request_id),
+                self._summary_key(request_id),
+                *(self._report_key(request_id, fmt) for fmt in REPORT_FORMATS),
+            )
+            pipe.zrem(self.index_key, request_id)
+            deleted, _ = await pipe.execute()
+        return deleted > 0
+
+    async def list_summaries(
+        self, offset: int = 0, limit: Optional[int] = 50
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return a page of session summaries, most recently saved first, and the total.
+
+        A limit of None returns every session from offset onwards.
+        """
+        # Index entries are scored by last save, so anything older than the TTL
+        # has expired even if no page ever reached it
+        await self.redis.zremrangebyscore(
+            self.index_key, "-inf", self._expired_before()
+        )
+
+        end = -1 if limit is None else offset + limit - 1
+        request_ids = await self.redis.zrevrange(self.index_key, offset, end)
+        if not request_ids:
+            return [], await self.redis.zcard(self.index_key)
+
+        summaries = []
+        expired = []
+        raw = await self.redis.mget(
+            [self._summary_key(rid.decode()) for rid in request_ids]
+        )
+        for request_id, data in zip(request_ids, raw):
+            if data is None:
+                expired.append(request_id)
+            else:
+                summaries.append(orjson.loads(data))
+
+        # Sessions expire by TTL; drop their index entries lazily
+        if expired:
+            await self.redis.zrem(self.index_key, *expired)
+
+        return summaries, await self.redis.zcard(self.index_key)
+
+
+def user_session_store(redis_client, user_id: str) -> ValidationSessionStore:
+    """Session store whose keys and listing index are scoped to one user."""
+    return ValidationSessionStore(
+        redis_client=redis_client, prefix=f"{USER_STORE_PREFIX}:{user_id}"
+    )
+
+
+def user_id_from_index_key(index_key: bytes) -> str:
+    """Recover the user ID from a per-user store's listing index key.
+
+    The known prefix and suffix are sliced off, so user IDs may contain ':'.
+    """
+    return (
+        index_key.decode()
+        .removeprefix(f"{USER_STORE_PREFIX}:")
+        .removesuffix(":index")
+    )
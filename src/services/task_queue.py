@@ -4,6 +4,7 @@ Redis-based Celery task queue with progress tracking.
 
 import asyncio
 import json
+import time
 from datetime import datetime
 from typing import Any, Optional
 from uuid import uuid4
@@ -15,8 +16,14 @@ from celery.signals import task_failure, task_postrun, task_prerun
 from kombu import Queue
 from src.core.config import get_validation_config
 from src.core.migration_validator import MigrationValidator
-from src.core.models import ValidationRequest, ValidationSession
+from src.core.models import (
+    MigrationValidationRequest,
+    ValidationRequest,
+    ValidationResult,
+    ValidationSession,
+)
 from src.services.llm_service import LLMService
+from src.services.session_store import ValidationSessionStore
 
 # Celery app configuration
 config = get_validation_config()
@@ -44,6 +51,7 @@ celery_app.conf.update(
         "src.services.task_queue.validate_migration_async": {"queue": "validation"},
         "src.services.task_queue.analyze_code_async": {"queue": "analysis"},
         "src.services.task_queue.compare_semantics_async": {"queue": "comparison"},
+        "run_validation_job": {"queue": "validation"},
     },
     task_queues=(
         Queue("default", routing_key="default"),
@@ -221,6 +229,57 @@ def validate_migration_async(self, request_data: dict[str, Any]) -> dict[str, An
         raise
 
 
+@celery_app.task(bind=True, name="run_validation_job")
+def run_validation_job(self, request_id: str, request_data: dict[str, Any]) -> None:
+    """Run a validation submitted through the REST API on a worker.
+
+    Status and results flow back to the API through the shared session store.
+    """
+    migration_request = MigrationValidationRequest.from_dict(request_data)
+    asyncio.run(_run_validation_job(request_id, migration_request))
+
+
+async def _run_validation_job(
+    request_id: str, migration_request: MigrationValidationRequest
+) -> None:
+    """Validate with a store whose Redis client is bound to this event loop."""
+    session_store = ValidationSessionStore()
+    try:
+        await run_stored_validation(request_id, migration_request, None, session_store)
+    finally:
+        await session_store.redis.aclose()
+
+
+async def run_stored_validation(
+    request_id: str,
+    migration_request: MigrationValidationRequest,
+    validator: Optional[MigrationValidator],
+    session_store: ValidationSessionStore,
+) -> None:
+    """Run a validation and record its session, or the failure, in the store.
+
+    Without a validator one is created here, so configuration errors are also
+    recorded on the session instead of leaving it processing.
+    """
+    try:
+        if validator is None:
+            validator = MigrationValidator()
+        session = await validator.validate_migration(migration_request)
+        await session_store.save(request_id, session)
+    except Exception as e:
+        # Update session with error
+        session = await session_store.get(request_id)
+        if session is not None:
+            session.add_log(f"Validation failed: {e!s}")
+            session.result = ValidationResult(
+                overall_status="error",
+                fidelity_score=0.0,
+                summary=f"Validation failed: {e!s}",
+                discrepancies=[],
+            )
+            await session_store.save(request_id, session)
+
+
 @celery_app.task(bind=True, name="analyze_code_async")
 def analyze_code_async(
     self, files: list[dict], technology: str, task_id: str = None
@@ -321,6 +380,9 @@ class AsyncValidationService:
     def __init__(self):
         self.progress_manager = progress_manager
         self.result_cache = result_cache
+        self._queue_stats: Optional[dict[str, Any]] = None
+        self._queue_stats_expires = 0.0
+        self._queue_stats_inflight: Optional[asyncio.Task] = None
 
     def submit_validation_task(self, request: ValidationRequest) -> str:
         """Submit validation task to queue."""
@@ -432,6 +494,31 @@ class AsyncValidationService:
 
         return stats
 
+    async def get_queue_stats_cached(self, ttl: float = 5.0) -> dict[str, Any]:
+        """Get queue statistics without blocking the event loop.
+
+        Celery inspection runs in a worker thread. The result is reused for
+        ``ttl`` seconds and concurrent callers share a single refresh.
+        """
+        if self._queue_stats is not None and time.monotonic() < self._queue_stats_expires:
+            return self._queue_stats
+
+        if self._queue_stats_inflight is None:
+            self._queue_stats_inflight = asyncio.create_task(
+                self._refresh_queue_stats(ttl)
+            )
+        return await asyncio.shield(self._queue_stats_inflight)
+
+    async def _refresh_queue_stats(self, ttl: float) -> dict[str, Any]:
+        """Refresh cached queue statistics from a worker thread."""
+        try:
+            stats = await asyncio.to_thread(self.get_queue_stats)
+            self._queue_stats = stats
+            self._queue_stats_expires = time.monotonic() + ttl
+            return stats
+        finally:
+            self._queue_stats_inflight = None
+
 
 # Task signal handlers for monitoring
 @task_prerun.connect
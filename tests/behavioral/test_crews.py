@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from src.behavioral.crews import (
+    BehavioralCrewPool,
     BehavioralValidationCrew,
     BehavioralValidationRequest,
     ComparisonJudgeAgent,
@@ -256,3 +257,32 @@ class TestBehavioralValidationFactory:
 
         assert isinstance(crew, BehavioralValidationCrew)
         assert crew.llm_service is None
+
+
+@pytest.mark.behavioral
+class TestBehavioralCrewPool:
+    """Test reuse of idle behavioral crews."""
+
+    @pytest.mark.asyncio
+    async def test_idle_crew_is_reused(self):
+        """Test a returned crew is handed to the next validation."""
+        pool = BehavioralCrewPool(factory=MagicMock)
+
+        async with pool.crew() as first:
+            pass
+        async with pool.crew() as second:
+            pass
+
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checkouts_get_separate_crews(self):
+        """Test a crew is never shared by two validations at once."""
+        pool = BehavioralCrewPool(factory=MagicMock, max_idle=1)
+
+        async with pool.crew() as first, pool.crew() as second:
+            assert first is not second
+
+        assert len(pool._idle) == 1
+        pool.clear()
+        assert pool._idle == []
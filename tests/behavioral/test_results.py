@@ -0,0 +1,115 @@
+"""Tests for recording behavioral results and combining them with static results."""
+
+from datetime import datetime
+
+import pytest
+from src.behavioral.crews import BehavioralValidationResult
+from src.behavioral.results import combine_hybrid_results, record_behavioral_error
+from src.core.models import SeverityLevel, ValidationDiscrepancy, ValidationResult
+
+
+def static_result(fidelity_score, **kwargs):
+    """Static validation result with the given fidelity."""
+    return ValidationResult(
+        overall_status="approved",
+        fidelity_score=fidelity_score,
+        summary="static",
+        execution_time=2.0,
+        **kwargs,
+    )
+
+
+def behavioral_result(fidelity_score, discrepancies=()):
+    """Behavioral validation result with the given fidelity."""
+    return BehavioralValidationResult(
+        overall_status="approved",
+        fidelity_score=fidelity_score,
+        discrepancies=list(discrepancies),
+        execution_log=[],
+        execution_time=3.0,
+        timestamp=datetime.now(),
+    )
+
+
+@pytest.mark.behavioral
+class TestCombineHybridResults:
+    """Test the hybrid combination of validation components."""
+
+    @pytest.mark.parametrize(
+        ("static_score", "behavioral_score", "expected_status"),
+        [
+            (0.8, 0.8, "approved"),
+            (0.8, 0.78, "approved_with_warnings"),
+            (0.6, 0.6, "approved_with_warnings"),
+            (0.6, 0.58, "rejected"),
+        ],
+    )
+    def test_status_thresholds(self, static_score, behavioral_score, expected_status):
+        """Test the averaged fidelity is classified at the threshold boundaries."""
+        result = combine_hybrid_results(
+            static_result(static_score), behavioral_result(behavioral_score)
+        )
+
+        assert result.overall_status == expected_status
+        assert result.fidelity_score == pytest.approx(
+            (static_score + behavioral_score) / 2
+        )
+
+    def test_both_components_are_merged(self):
+        """Test discrepancies and execution times of both components are combined."""
+        static_issue = ValidationDiscrepancy(
+            "missing_field", SeverityLevel.WARNING, "a"
+        )
+        behavioral_issue = ValidationDiscrepancy(
+            "behavior_mismatch", SeverityLevel.CRITICAL, "b"
+        )
+
+        result = combine_hybrid_results(
+            static_result(0.9, discrepancies=[static_issue]),
+            behavioral_result(0.9, discrepancies=[behavioral_issue]),
+        )
+
+        assert result.discrepancies == [static_issue, behavioral_issue]
+        assert result.execution_time == 5.0
+
+    def test_static_only_leaves_component_untouched(self):
+        """Test a static-only result is a copy with its own summary."""
+        component = static_result(0.75)
+
+        result = combine_hybrid_results(component, None)
+
+        assert result is not component
+        assert component.summary == "static"
+        assert result.summary == "Static validation completed. Fidelity score: 0.75"
+        assert result.fidelity_score == 0.75
+
+    def test_behavioral_only_is_converted(self):
+        """Test a behavioral-only result becomes a ValidationResult."""
+        result = combine_hybrid_results(None, behavioral_result(0.5))
+
+        assert isinstance(result, ValidationResult)
+        assert result.overall_status == "approved"
+        assert result.execution_time == 3.0
+
+    def test_no_components(self):
+        """Test there is nothing to combine when neither component ran."""
+        assert combine_hybrid_results(None, None) is None
+
+
+@pytest.mark.behavioral
+class TestRecordBehavioralError:
+    """Test failed behavioral sessions are recorded in one update."""
+
+    def test_session_marked_failed(self):
+        """Test status, result, discrepancies and logs describe the failure."""
+        session = {"status": "running", "logs": [], "row": {"status": "running"}}
+
+        record_behavioral_error(session, RuntimeError("browser crashed"))
+
+        assert session["status"] == "error"
+        assert session["progress"] == "Behavioral validation failed: browser crashed"
+        assert session["result"].overall_status == "error"
+        assert session["result"].fidelity_score == 0.0
+        assert session["discrepancies"][0]["severity"] == "critical"
+        assert session["logs"] == ["Behavioral validation error: browser crashed"]
+        assert "row" not in session
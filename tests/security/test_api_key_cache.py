@@ -0,0 +1,87 @@
+"""Tests for cached API key validation."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from src.security import api_keys
+from src.security.api_keys import APIKeyManager
+
+
+@pytest.fixture(autouse=True)
+def clear_api_key_cache():
+    """Start every test with an empty API key cache."""
+    api_keys._api_key_cache.clear()
+    yield
+    api_keys._api_key_cache.clear()
+
+
+@pytest.fixture
+def manager():
+    """API key manager backed by a mocked database service."""
+    manager = APIKeyManager()
+    manager._hash_api_key = lambda api_key: f"hashed-{api_key}"
+    manager.db = AsyncMock()
+    manager.db.get_api_key_by_hash.return_value = {
+        "metadata": {
+            "id": "key_1",
+            "name": "ci",
+            "description": None,
+            "scopes": ["read_only"],
+            "created_at": datetime.utcnow(),
+            "expires_at": None,
+            "last_used_at": None,
+            "rate_limit_per_minute": 60,
+            "is_active": True,
+            "created_by": "admin",
+        }
+    }
+    manager.db.deactivate_api_key.return_value = True
+    return manager
+
+
+class TestValidateAPIKeyCached:
+    """Test reuse of successful API key validations."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_validation_hits_cache(self, manager):
+        """Test the database is only consulted once while the key is cached."""
+        first = await manager.validate_api_key("amvs_secret")
+        second = await manager.validate_api_key("amvs_secret")
+
+        assert second is first
+        manager.db.get_api_key_by_hash.assert_awaited_once_with("hashed-amvs_secret")
+        manager.db.update_api_key_last_used.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_revoke_clears_cached_key(self, manager):
+        """Test a revoked key is validated against the database again."""
+        await manager.validate_api_key("amvs_secret")
+
+        assert await manager.revoke_api_key("key_1", revoked_by="admin") is True
+        assert len(api_keys._api_key_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_not_served_from_cache(self, manager):
+        """Test a cached key past its expires_at is checked again."""
+        metadata = await manager.validate_api_key("amvs_secret")
+        metadata.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        manager.db.get_api_key_by_hash.return_value["metadata"]["expires_at"] = (
+            metadata.expires_at
+        )
+
+        with pytest.raises(api_keys.HTTPException) as exc_info:
+            await manager.validate_api_key("amvs_secret")
+
+        assert exc_info.value.status_code == 401
+        assert manager.db.get_api_key_by_hash.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, manager, monkeypatch):
+        """Test the least recently used entry is evicted past the size limit."""
+        monkeypatch.setattr(api_keys, "API_KEY_CACHE_SIZE", 2)
+
+        for i in range(3):
+            await manager.validate_api_key(f"amvs_secret{i}")
+
+        assert len(api_keys._api_key_cache) == 2
@@ -0,0 +1,152 @@
+"""Unit tests for security audit batching."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from src.security import audit as audit_module
+from src.security.audit import SecurityAuditLogger
+
+
+class TestAuditBatching:
+    """Test batched audit event storage."""
+
+    @pytest.fixture
+    def batch_db(self, monkeypatch):
+        """Security database service the worker writes batches through."""
+        batch_db = AsyncMock()
+        batch_db.sessions = []
+        monkeypatch.setattr(
+            audit_module,
+            "SecurityDatabaseService",
+            lambda session: batch_db.sessions.append(session) or batch_db,
+        )
+        return batch_db
+
+    @pytest.fixture
+    def audit(self, batch_db):
+        """Audit logger whose batches use their own mocked sessions."""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield object()
+
+        audit = SecurityAuditLogger(session_factory=session_factory)
+        audit.db = AsyncMock()
+        return audit
+
+    @pytest.mark.asyncio
+    async def test_events_written_in_batches(self, audit, batch_db):
+        """Test queued events are stored in batches of batch_size."""
+        batch_size = audit.settings.audit_batch_size
+
+        for _ in range(batch_size + 1):
+            await audit.log_data_access(
+                user_id=None,
+                api_key_id=None,
+                resource="/api/test",
+                action="GET",
+                source_ip="127.0.0.1",
+            )
+        await asyncio.sleep(audit.settings.audit_max_flush_interval_ms / 1000 * 2)
+
+        sizes = [
+            len(call.args[0])
+            for call in batch_db.store_audit_events_bulk.await_args_list
+        ]
+        assert sizes == [batch_size, 1]
+        # Each batch gets a session of its own; the request session is untouched
+        assert len(set(map(id, batch_db.sessions))) == 2
+        audit.db.store_audit_event.assert_not_awaited()
+        await audit.flush()
+
+    @pytest.mark.asyncio
+    async def test_flush_stores_pending_events(self, audit, batch_db):
+        """Test flush stores events still waiting in the queue."""
+        await audit.log_data_access(
+            user_id="user123",
+            api_key_id=None,
+            resource="/api/test",
+            action="GET",
+            source_ip="127.0.0.1",
+        )
+        await audit.flush()
+
+        stored = [
+            event
+            for call in batch_db.store_audit_events_bulk.await_args_list
+            for event in call.args[0]
+        ]
+        assert len(stored) == 1
+        assert stored[0]["user_id"] == "user123"
+        assert audit._audit_worker_task is None
+
+    @pytest.mark.asyncio
+    async def test_flush_stores_batch_held_by_worker(self, audit, batch_db):
+        """Test flush waits for the batch the worker already took off the queue."""
+        await audit.log_data_access(
+            user_id="user123",
+            api_key_id=None,
+            resource="/api/test",
+            action="GET",
+            source_ip="127.0.0.1",
+        )
+        # Let the worker take the event and wait for more
+        await asyncio.sleep(0)
+        assert audit._audit_queue.empty()
+
+        await audit.flush()
+
+        batch_db.store_audit_events_bulk.assert_awaited_once()
+        assert batch_db.store_audit_events_bulk.await_args.args[0][0]["user_id"] == (
+            "user123"
+        )
+
+    @pytest.mark.asyncio
+    async def test_restarted_worker_keeps_pending_events(self, audit, batch_db):
+        """Test events queued for a stopped worker are carried to its replacement."""
+        for user_id in ("user1", "user2"):
+            await audit.log_data_access(
+                user_id=user_id,
+                api_key_id=None,
+                resource="/api/test",
+                action="GET",
+                source_ip="127.0.0.1",
+            )
+            # Stop the worker before it runs, leaving the event queued
+            audit._audit_worker_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await audit._audit_worker_task
+
+        await audit.flush()
+
+        stored = [
+            event["user_id"]
+            for call in batch_db.store_audit_events_bulk.await_args_list
+            for event in call.args[0]
+        ]
+        assert stored == ["user1", "user2"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_waits_for_worker(self, audit, batch_db, monkeypatch):
+        """Test a full queue waits for room instead of writing the event inline."""
+        monkeypatch.setattr(audit.settings, "audit_max_queue_size", 1)
+
+        for user_id in ("user1", "user2"):
+            await audit.log_data_access(
+                user_id=user_id,
+                api_key_id=None,
+                resource="/api/test",
+                action="GET",
+                source_ip="127.0.0.1",
+            )
+        await audit.flush()
+
+        stored = [
+            event["user_id"]
+            for call in batch_db.store_audit_events_bulk.await_args_list
+            for event in call.args[0]
+        ]
+        assert stored == ["user1", "user2"]
+        audit.db.store_audit_event.assert_not_awaited()
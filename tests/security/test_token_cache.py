@@ -0,0 +1,62 @@
+"""Tests for cached JWT access token decoding."""
+
+from datetime import timedelta
+
+import pytest
+from src.security import auth
+from src.security.auth import create_access_token, decode_access_token_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty token cache."""
+    auth._token_cache.clear()
+    yield
+    auth._token_cache.clear()
+
+
+class TestDecodeAccessTokenCached:
+    """Test reuse of decoded access tokens."""
+
+    def test_repeat_decode_hits_cache(self, monkeypatch):
+        """Test a valid token is only verified once while cached."""
+        token = create_access_token({"sub": "admin", "role": "admin"})
+        calls = []
+        decode = auth.decode_access_token
+
+        def counting_decode(value):
+            calls.append(value)
+            return decode(value)
+
+        monkeypatch.setattr(auth, "decode_access_token", counting_decode)
+
+        first = decode_access_token_cached(token)
+        second = decode_access_token_cached(token)
+
+        assert first["sub"] == "admin"
+        assert second is first
+        assert len(calls) == 1
+
+    def test_invalid_token_not_cached(self):
+        """Test tokens that fail verification are not stored."""
+        assert decode_access_token_cached("not-a-jwt") is None
+        assert len(auth._token_cache) == 0
+
+    def test_entry_never_outlives_exp(self):
+        """Test cached entries expire no later than the token itself."""
+        token = create_access_token({"sub": "admin"}, timedelta(seconds=5))
+
+        payload = decode_access_token_cached(token)
+
+        (_, valid_until), = auth._token_cache.values()
+        assert valid_until <= payload["exp"]
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test the least recently used entry is evicted past the size limit."""
+        monkeypatch.setattr(auth, "TOKEN_CACHE_SIZE", 2)
+        tokens = [create_access_token({"sub": f"user{i}"}) for i in range(3)]
+
+        for token in tokens:
+            decode_access_token_cached(token)
+
+        assert len(auth._token_cache) == 2
@@ -0,0 +1,36 @@
+"""Unit tests for system health monitoring."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from src.monitoring.health import SystemHealthMonitor
+
+
+@pytest.mark.unit
+class TestCachedCheckHealth:
+    """Test reuse of recent health check results."""
+
+    @pytest.fixture
+    def monitor(self):
+        """Health monitor with check execution mocked out."""
+        monitor = SystemHealthMonitor()
+        monitor.check_health = AsyncMock(return_value={"status": "healthy"})
+        return monitor
+
+    @pytest.mark.asyncio
+    async def test_result_reused_within_ttl(self, monitor):
+        """Test checks run once while the cached result is fresh."""
+        first = await monitor.cached_check_health(ttl=60)
+        second = await monitor.cached_check_health(ttl=60)
+
+        assert first is second
+        monitor.check_health.assert_awaited_once_with(include_details=False)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_rerun(self, monitor):
+        """Test invalidation makes the next call re-run the checks."""
+        await monitor.cached_check_health(ttl=60)
+        monitor.invalidate_health_cache()
+        await monitor.cached_check_health(ttl=60)
+
+        assert monitor.check_health.await_count == 2
@@ -225,3 +225,62 @@ class TestInputProcessorUtils:
         assert "number_of_functions" in metrics
         assert "number_of_classes" in metrics
         assert metrics["lines_of_code"] > 0
+
+
+@pytest.mark.unit
+class TestUploadPaths:
+    """Test moving spooled uploads into the upload directory."""
+
+    def _spool(self, processor, content: bytes) -> str:
+        with tempfile.NamedTemporaryFile(
+            dir=processor.upload_dir, suffix=".part", delete=False
+        ) as tmp:
+            tmp.write(content)
+        return tmp.name
+
+    def test_moves_spooled_files(self):
+        """Test spooled files are moved under the context directory."""
+        processor = InputProcessor()
+        spooled = self._spool(processor, b"print('hi')")
+
+        saved = processor.upload_paths([("app.py", spooled)], "source")
+
+        assert saved == [os.path.join(processor.upload_dir, "source", "app.py")]
+        assert not os.path.exists(spooled)
+        with open(saved[0], "rb") as f:
+            assert f.read() == b"print('hi')"
+
+    def test_invalid_upload_removes_spooled_files(self):
+        """Test a rejected upload leaves no spooled files behind."""
+        processor = InputProcessor()
+        valid = self._spool(processor, b"x = 1")
+        invalid = self._spool(processor, b"MZ")
+
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            processor.upload_paths([("a.py", valid), ("b.exe", invalid)], "source")
+
+        assert not os.path.exists(valid)
+        assert not os.path.exists(invalid)
+
+    def test_groups_are_moved_only_when_all_are_valid(self):
+        """Test a rejected file in one group leaves no group's files behind."""
+        processor = InputProcessor()
+        source = self._spool(processor, b"x = 1")
+        target = self._spool(processor, b"y = 2")
+
+        saved = processor.upload_path_groups(
+            {"source": [("a.py", source)], "target": [("b.py", target)], "empty": []}
+        )
+        assert saved["source"] == [os.path.join(processor.upload_dir, "source", "a.py")]
+        assert saved["target"] == [os.path.join(processor.upload_dir, "target", "b.py")]
+        assert saved["empty"] == []
+
+        valid = self._spool(processor, b"x = 1")
+        invalid = self._spool(processor, b"MZ")
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            processor.upload_path_groups(
+                {"source": [("a.py", valid)], "target": [("b.exe", invalid)]}
+            )
+
+        assert not os.path.exists(valid)
+        assert not os.path.exists(invalid)
@@ -0,0 +1,50 @@
+"""Unit tests for the Prometheus metrics collector."""
+
+import pytest
+from src.monitoring.metrics import MetricsCollector
+
+
+@pytest.fixture
+def collector():
+    """Fresh metrics collector with its own registry."""
+    return MetricsCollector()
+
+
+def _sample_lines(collector: MetricsCollector, prefix: str) -> list[str]:
+    output = collector.generate_metrics().decode("utf-8")
+    return [line for line in output.splitlines() if line.startswith(prefix)]
+
+
+@pytest.mark.unit
+class TestUpdateFromMapping:
+    """Test batched gauge updates."""
+
+    def test_sets_plain_and_labelled_gauges(self, collector):
+        """Test plain and single-label gauge keys are both applied."""
+        collector.update_from_mapping(
+            {
+                "cache_size": 1024,
+                "task_queue_size:default": 3,
+                "worker_active_tasks:worker-1": 2,
+            }
+        )
+
+        assert _sample_lines(collector, "cache_size_bytes") == ["cache_size_bytes 1024.0"]
+        assert _sample_lines(collector, "celery_queue_size") == [
+            'celery_queue_size{queue_name="default"} 3.0'
+        ]
+        assert _sample_lines(collector, "celery_worker_active_tasks") == [
+            'celery_worker_active_tasks{worker_name="worker-1"} 2.0'
+        ]
+
+    def test_reuses_cached_handles(self, collector):
+        """Test repeated updates reuse the resolved gauge handle."""
+        collector.update_from_mapping({"task_queue_size:default": 1})
+        handle = collector._gauge_handles["task_queue_size:default"]
+
+        collector.update_queue_metrics({"queue_sizes": {"default": 5}})
+
+        assert collector._gauge_handles["task_queue_size:default"] is handle
+        assert _sample_lines(collector, "celery_queue_size") == [
+            'celery_queue_size{queue_name="default"} 5.0'
+        ]
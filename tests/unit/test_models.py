@@ -762,6 +762,19 @@ class TestValidationSession:
             assert log_entry.startswith("[")
             assert "]" in log_entry
 
+    def test_validation_session_latest_log(self, sample_validation_request):
+        """Test latest_log and log_count track the processing log."""
+        session = ValidationSession(request=sample_validation_request)
+
+        assert session.latest_log is None
+        assert session.log_count == 0
+
+        session.add_log("First log entry")
+        session.add_log("Second log entry")
+
+        assert session.latest_log.endswith("Second log entry")
+        assert session.log_count == 2
+
     def test_validation_session_log_timestamps(self, sample_validation_request):
         """Test that log entries have proper timestamps."""
         session = ValidationSession(request=sample_validation_request)
@@ -986,3 +999,66 @@ class TestModelEdgeCases:
             )  # Later timestamp should be >= earlier
 
 
+
+
+@pytest.mark.unit
+class TestValidationSessionSerialization:
+    """Test ValidationSession to_dict/from_dict round trips."""
+
+    def test_round_trip_preserves_nested_types(self):
+        """Test enums, datetimes and nested dataclasses survive a round trip."""
+        request = MigrationValidationRequest(
+            source_technology=TechnologyContext(type=TechnologyType.PYTHON_FLASK),
+            target_technology=TechnologyContext(
+                type=TechnologyType.JAVA_SPRING, version="3.0"
+            ),
+            validation_scope=ValidationScope.FULL_SYSTEM,
+            source_input=InputData(type=InputType.CODE_FILES, files=["a.py"]),
+            target_input=InputData(type=InputType.CODE_FILES, files=["A.java"]),
+        )
+        session = ValidationSession(
+            request=request,
+            source_representation=AbstractRepresentation(
+                ui_elements=[UIElement(type="button", id="submit")]
+            ),
+            result=ValidationResult(
+                overall_status="approved",
+                fidelity_score=0.9,
+                summary="ok",
+                discrepancies=[
+                    ValidationDiscrepancy(
+                        type="missing_field",
+                        severity=SeverityLevel.WARNING,
+                        description="email missing",
+                    )
+                ],
+            ),
+        )
+        session.add_log("started")
+
+        restored = ValidationSession.from_dict(session.to_dict())
+
+        assert restored == session
+        assert restored.result.discrepancies[0].severity is SeverityLevel.WARNING
+        assert isinstance(restored.request.created_at, datetime)
+
+    def test_request_round_trip(self):
+        """Test a migration request survives a round trip on its own."""
+        request = MigrationValidationRequest(
+            source_technology=TechnologyContext(type=TechnologyType.PHP_LARAVEL),
+            target_technology=TechnologyContext(type=TechnologyType.PYTHON_DJANGO),
+            validation_scope=ValidationScope.API_ENDPOINTS,
+            source_input=InputData(type=InputType.CODE_FILES, files=["a.php"]),
+            target_input=InputData(type=InputType.SCREENSHOTS, screenshots=["b.png"]),
+        )
+
+        assert MigrationValidationRequest.from_dict(request.to_dict()) == request
+
+    def test_round_trip_without_request(self):
+        """Test sessions created before their request is known round trip."""
+        session = ValidationSession(request=None, processing_log=["queued"])
+
+        restored = ValidationSession.from_dict(session.to_dict())
+
+        assert restored.request is None
+        assert restored.processing_log == ["queued"]
@@ -0,0 +1,280 @@
+"""Unit tests for the Redis-backed validation session store."""
+
+import gzip
+from datetime import datetime, timedelta
+
+import pytest
+from src.core.models import (
+    InputData,
+    InputType,
+    MigrationValidationRequest,
+    SeverityLevel,
+    TechnologyContext,
+    TechnologyType,
+    ValidationDiscrepancy,
+    ValidationResult,
+    ValidationScope,
+    ValidationSession,
+)
+from src.services.session_store import (
+    ValidationSessionStore,
+    user_id_from_index_key,
+    user_session_store,
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio commands the store uses."""
+
+    def __init__(self):
+        self.data: dict[bytes, bytes] = {}
+        self.ttls: dict[bytes, int] = {}
+        self.zsets: dict[str, dict[bytes, float]] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def set(self, key, value, ex=None):
+        self.data[key.encode()] = value
+        self.ttls[key.encode()] = ex
+
+    async def get(self, key):
+        return self.data.get(key.encode())
+
+    async def strlen(self, key):
+        return len(self.data.get(key.encode(), b""))
+
+    async def getrange(self, key, start, end):
+        return self.data.get(key.encode(), b"")[start : end + 1]
+
+    async def mget(self, keys):
+        return [self.data.get(key.encode()) for key in keys]
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key.encode(), None) is not None for key in keys)
+
+    async def zadd(self, key, mapping, nx=False):
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not (nx and member.encode() in zset):
+                zset[member.encode()] = score
+
+    async def zrevrange(self, key, start, end):
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda m: -m[1])
+        stop = None if end == -1 else end + 1
+        return [member for member, _ in members[start:stop]]
+
+    async def zrem(self, key, *members):
+        zset = self.zsets.get(key, {})
+        for member in members:
+            zset.pop(member if isinstance(member, bytes) else member.encode(), None)
+
+    async def zremrangebyscore(self, key, min, max):
+        zset = self.zsets.get(key, {})
+        bound = float(max.lstrip("("))
+        for member, score in list(zset.items()):
+            if score < bound if max.startswith("(") else score <= bound:
+                del zset[member]
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def aclose(self):
+        pass
+
+
+class FakePipeline:
+    """Queues commands and applies them on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.calls
+        ]
+
+
+@pytest.mark.unit
+class TestValidationSessionStore:
+    """Test session persistence, status snapshots and listing."""
+
+    @pytest.fixture
+    def store(self):
+        """Session store backed by the in-memory fake."""
+        return ValidationSessionStore(redis_client=FakeRedis(), ttl=60)
+
+    @pytest.mark.asyncio
+    async def test_save_and_get_round_trip(self, store):
+        """Test a saved session is returned intact with the TTL applied."""
+        session = ValidationSession(request=None)
+        session.add_log("queued")
+
+        await store.save("req_1", session)
+
+        assert await store.get("req_1") == session
+        assert set(store.redis.ttls.values()) == {60}
+
+    @pytest.mark.asyncio
+    async def test_status_snapshot_tracks_result(self, store):
+        """Test the status key reflects processing and completed sessions."""
+        session = ValidationSession(request=None, processing_log=["step"])
+        await store.save("req_1", session)
+        assert (await store.get_status("req_1"))["status"] == "processing"
+
+        session.result = ValidationResult(
+            overall_status="approved", fidelity_score=1.0, summary="ok"
+        )
+        await store.save("req_1", session)
+
+        status = await store.get_status("req_1")
+        assert status["status"] == "completed"
+        assert status["result_available"] is True
+
+    @pytest.mark.asyncio
+    async def test_result_snapshot_counts_discrepancies(self, store):
+        """Test the result key is written on completion with severity counts."""
+        session = ValidationSession(request=None)
+        await store.save("req_1", session)
+        assert await store.get_result("req_1") is None
+
+        session.result = ValidationResult(
+            overall_status="rejected",
+            fidelity_score=0.5,
+            summary="diffs",
+            discrepancies=[
+                ValidationDiscrepancy("missing_field", SeverityLevel.CRITICAL, "a"),
+                ValidationDiscrepancy("type_mismatch", SeverityLevel.WARNING, "b"),
+                ValidationDiscrepancy("missing_field", SeverityLevel.CRITICAL, "c"),
+            ],
+        )
+        await store.save("req_1", session)
+
+        result = await store.get_result("req_1")
+        assert result["discrepancy_counts"] == {"critical": 2, "warning": 1, "info": 0}
+        assert result["timestamp"] == session.result.timestamp.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_list_and_delete(self, store):
+        """Test listing pages newest first and delete removes the session."""
+        for request_id in ("req_1", "req_2", "req_3"):
+            await store.save(request_id, ValidationSession(request=None))
+
+        summaries, total = await store.list_summaries(offset=0, limit=2)
+        assert [s["request_id"] for s in summaries] == ["req_3", "req_2"]
+        assert total == 3
+
+        summaries, _ = await store.list_summaries(offset=1, limit=None)
+        assert [s["request_id"] for s in summaries] == ["req_2", "req_1"]
+
+        assert await store.delete("req_1") is True
+        assert await store.get_status("req_1") is None
+        assert await store.delete("req_1") is False
+        assert (await store.list_summaries())[1] == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_sessions_leave_index(self, store):
+        """Test index entries whose summary expired are dropped on listing."""
+        await store.save("req_1", ValidationSession(request=None))
+        await store.save("req_2", ValidationSession(request=None))
+        store.redis.data.pop(b"session:summary:req_1")
+
+        summaries, total = await store.list_summaries()
+
+        assert [s["request_id"] for s in summaries] == ["req_2"]
+        assert total == 1
+
+    @pytest.mark.asyncio
+    async def test_index_entries_older_than_ttl_are_pruned(self, store):
+        """Test listing drops index entries past the TTL outside the page read."""
+        for request_id in ("req_1", "req_2", "req_3"):
+            await store.save(request_id, ValidationSession(request=None))
+        store.redis.zsets[store.index_key][b"req_1"] -= store.ttl + 1
+
+        summaries, total = await store.list_summaries(offset=0, limit=1)
+
+        assert [s["request_id"] for s in summaries] == ["req_3"]
+        assert total == 2
+        assert b"req_1" not in store.redis.zsets[store.index_key]
+
+    @pytest.mark.asyncio
+    async def test_resaved_session_stays_listed(self, store):
+        """Test a session saved again after its creation TTL is still listed."""
+        request = MigrationValidationRequest(
+            source_technology=TechnologyContext(type=TechnologyType.PYTHON_FLASK),
+            target_technology=TechnologyContext(type=TechnologyType.JAVA_SPRING),
+            validation_scope=ValidationScope.BACKEND_FUNCTIONALITY,
+            source_input=InputData(type=InputType.CODE_FILES),
+            target_input=InputData(type=InputType.CODE_FILES),
+            created_at=datetime.now() - timedelta(seconds=store.ttl * 2),
+        )
+        await store.save("req_1", ValidationSession(request=request))
+
+        summaries, total = await store.list_summaries()
+
+        assert [s["request_id"] for s in summaries] == ["req_1"]
+        assert total == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_cached_reports(self, store):
+        """Test rendered reports are cached gzipped and dropped with their session."""
+        await store.save("req_1", ValidationSession(request=None))
+        compressed = await store.save_report("req_1", "json", '{"ok": true}')
+
+        assert await store.report_size("req_1", "json") == len(compressed)
+        assert gzip.decompress(compressed) == b'{"ok": true}'
+
+        await store.delete("req_1")
+
+        assert await store.report_size("req_1", "json") == 0
+
+    @pytest.mark.asyncio
+    async def test_reports_are_scoped_to_store_prefix(self, store):
+        """Test stores with different prefixes never see each other's reports."""
+        other = ValidationSessionStore(redis_client=store.redis, ttl=60, prefix="other")
+        await store.save_report("req_1", "json", '{"ok": true}')
+
+        assert await other.report_size("req_1", "json") == 0
+        assert await store.report_size("req_1", "json") > 0
+
+    @pytest.mark.asyncio
+    async def test_iter_report_yields_chunks(self, store):
+        """Test cached reports are read back in chunks that reassemble exactly."""
+        compressed = await store.save_report("req_1", "html", "<p>report</p>" * 500)
+
+        chunks = [c async for c in store.iter_report("req_1", "html", chunk_size=100)]
+
+        assert all(len(c) <= 100 for c in chunks)
+        assert b"".join(chunks) == compressed
+
+
+@pytest.mark.unit
+class TestUserSessionStores:
+    """Test per-user session stores and recovering users from their index keys."""
+
+    @pytest.mark.asyncio
+    async def test_user_id_with_colon_round_trips(self):
+        """Test a user ID containing ':' is recovered whole from its index key."""
+        redis = FakeRedis()
+        store = user_session_store(redis, "team:alice")
+        await store.save("req_1", ValidationSession(request=None))
+
+        user_id = user_id_from_index_key(store.index_key.encode())
+        summaries, _ = await user_session_store(redis, user_id).list_summaries()
+
+        assert user_id == "team:alice"
+        assert [s["request_id"] for s in summaries] == ["req_1"]
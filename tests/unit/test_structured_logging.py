@@ -0,0 +1,39 @@
+"""Unit tests for structured logging."""
+
+import pytest
+from src.monitoring.logging import StructuredLogger
+
+
+@pytest.mark.unit
+class TestRecentEntries:
+    """Test the in-memory buffer of recent log entries."""
+
+    @pytest.fixture
+    def structured(self, capsys):
+        """Structured logger with a few entries recorded."""
+        structured = StructuredLogger("test_logger")
+        structured.info("first", component="api")
+        structured.warning("second", component="db")
+        structured.info("third", component="db")
+        capsys.readouterr()
+        return structured
+
+    def test_newest_first_with_limit(self, structured):
+        """Test entries are returned newest first and capped at limit."""
+        entries = structured.recent_entries(limit=2)
+
+        assert [e["event"] for e in entries] == ["third", "second"]
+
+    def test_filters_by_level_and_component(self, structured):
+        """Test level filtering is case-insensitive and combines with component."""
+        assert [e["event"] for e in structured.recent_entries(10, level="INFO")] == [
+            "third",
+            "first",
+        ]
+        assert [
+            e["event"] for e in structured.recent_entries(10, "info", component="db")
+        ] == ["third"]
+
+    def test_buffer_is_bounded(self, structured):
+        """Test the buffer never grows past its configured size."""
+        assert structured._ring.maxlen == structured.config.settings.log_buffer_size
@@ -0,0 +1,127 @@
+"""Unit tests for the async validation service."""
+
+import asyncio
+import time
+
+import pytest
+from src.core.models import (
+    InputData,
+    InputType,
+    MigrationValidationRequest,
+    TechnologyContext,
+    TechnologyType,
+    ValidationResult,
+    ValidationScope,
+    ValidationSession,
+)
+from src.services import task_queue
+from src.services.session_store import ValidationSessionStore
+from src.services.task_queue import AsyncValidationService
+
+from tests.unit.test_session_store import FakeRedis
+
+
+@pytest.mark.unit
+class TestQueueStatsCache:
+    """Test non-blocking cached queue statistics."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_lookup(self):
+        """Test concurrent callers share one inspection and later calls hit the cache."""
+        service = AsyncValidationService()
+        calls = []
+
+        def fake_stats():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"active_tasks": 1, "scheduled_tasks": 0, "workers": []}
+
+        service.get_queue_stats = fake_stats
+
+        results = await asyncio.gather(
+            *(service.get_queue_stats_cached() for _ in range(5))
+        )
+        cached = await service.get_queue_stats_cached()
+
+        assert len(calls) == 1
+        assert all(result["active_tasks"] == 1 for result in results)
+        assert cached is results[0]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refreshed(self):
+        """Test statistics are fetched again once the TTL has elapsed."""
+        service = AsyncValidationService()
+        calls = []
+
+        def fake_stats():
+            calls.append(1)
+            return {"active_tasks": len(calls)}
+
+        service.get_queue_stats = fake_stats
+
+        await service.get_queue_stats_cached(ttl=0)
+        result = await service.get_queue_stats_cached(ttl=0)
+
+        assert len(calls) == 2
+        assert result["active_tasks"] == 2
+
+
+@pytest.mark.unit
+class TestRunValidationJob:
+    """Test the worker-side job that records validations in the session store."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        """Session store backed by the in-memory fake, used by the job."""
+        store = ValidationSessionStore(redis_client=FakeRedis(), ttl=60)
+        monkeypatch.setattr(task_queue, "ValidationSessionStore", lambda: store)
+        return store
+
+    @pytest.fixture
+    def request_obj(self):
+        """Minimal migration request."""
+        return MigrationValidationRequest(
+            source_technology=TechnologyContext(type=TechnologyType.PYTHON_FLASK),
+            target_technology=TechnologyContext(type=TechnologyType.JAVA_SPRING),
+            validation_scope=ValidationScope.BACKEND_FUNCTIONALITY,
+            source_input=InputData(type=InputType.CODE_FILES),
+            target_input=InputData(type=InputType.CODE_FILES),
+            request_id="req_1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_completed_session_is_saved(self, store, request_obj, monkeypatch):
+        """Test the job builds a validator and stores the finished session."""
+
+        class FakeValidator:
+            async def validate_migration(self, request):
+                session = ValidationSession(request=request)
+                session.result = ValidationResult(
+                    overall_status="approved", fidelity_score=1.0, summary="ok"
+                )
+                return session
+
+        monkeypatch.setattr(task_queue, "MigrationValidator", FakeValidator)
+        await store.save("req_1", ValidationSession(request=request_obj))
+
+        await task_queue._run_validation_job("req_1", request_obj)
+
+        assert (await store.get_status("req_1"))["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_validator_setup_failure_is_recorded(
+        self, store, request_obj, monkeypatch
+    ):
+        """Test a validator that cannot be built marks the session as failed."""
+
+        def broken_validator():
+            raise TypeError("missing configs")
+
+        monkeypatch.setattr(task_queue, "MigrationValidator", broken_validator)
+        await store.save("req_1", ValidationSession(request=request_obj))
+
+        await task_queue._run_validation_job("req_1", request_obj)
+
+        status = await store.get_status("req_1")
+        assert status["status"] == "error"
+        assert "missing configs" in status["message"]